@@ -17,8 +17,11 @@ urlpatterns = [
     path('test/fetch-genres/<int:artist_id>/', views.fetch_genres_for_artist, name='fetch_genres_artist'),
     path('test/fetch-all-genres/', views.fetch_all_genres, name='fetch_all_genres'),
     path('test/artists/', views.list_artists_with_genres, name='list_artists_genres'),
+    path('artists/catalog/', views.artist_catalog, name='artist_catalog'),
     path('test/music-stats/', views.music_stats, name='music_stats'),
     path('debug/wikipedia/<str:artist_name>/', views.debug_wikipedia, name='debug_wikipedia'),
     path('debug/genre-extraction/<str:artist_name>/', views.debug_genre_extraction, name='debug_genre_extraction'),
+    path('debug/nlp-models/', views.nlp_model_status, name='nlp_model_status'),
+    path('debug/spotify-client/', views.spotify_client_status, name='spotify_client_status'),
     path('debug/clear-cache/', views.clear_cache, name='clear_cache'),
 ]
\ No newline at end of file
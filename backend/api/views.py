@@ -4,15 +4,22 @@ from spotify.models import SpotifyToken
 from .serializer import ItemSerializer
 from spotify.views import *
 import spotify.util as spotify
+from spotify.client import get_spotify_client
 import json
+import logging
 import requests
 from django.core.cache import cache
 from django.conf import settings
+from django.http import StreamingHttpResponse
 import hashlib
 from datetime import timedelta
 from django.utils import timezone
-from music.models import Artist, Genre, ArtistGenre
+from music.models import Artist, ArtistGenre, MusicStats, normalize_artist_name
 from music.services import WikipediaGenreService
+from music.concurrency import run_concurrently
+from music.enrichment import GenreEnrichmentEngine
+
+logger = logging.getLogger(__name__)
 
 @api_view(['GET'])
 def getData(request):
@@ -38,11 +45,12 @@ def top_tracks(request):
     if cached_data:
         return Response(cached_data)
     
-    headers = {'Authorization': f'Bearer {user_token.access_token}'}
     params = {'limit': limit, 'time_range': time_range}
-    endpoint = 'https://api.spotify.com/v1/me/top/tracks'
     
-    response = requests.get(endpoint, headers=headers, params=params)
+    try:
+        response = get_spotify_client().get('/me/top/tracks', user_token.access_token, params=params)
+    except requests.RequestException:
+        return Response({"error": "Spotify did not respond"}, status=502)
     
     if response.status_code == 200:
         data = response.json()
@@ -74,54 +82,32 @@ def top_artists(request):
         return Response(cached_data)
     
     time_range = request.GET.get('time_range', 'medium_term')
-    headers = {'Authorization': f'Bearer {user_token.access_token}'}
     params = {'limit': limit, 'time_range': time_range}
-    endpoint = 'https://api.spotify.com/v1/me/top/artists'
     
-    response = requests.get(endpoint, headers=headers, params=params)
+    try:
+        response = get_spotify_client().get('/me/top/artists', user_token.access_token, params=params)
+    except requests.RequestException:
+        return Response({"error": "Spotify did not respond"}, status=502)
     
     if response.status_code == 200:
         data = response.json()
         
         # If Wikipedia integration is enabled, enhance artist data with Wikipedia genres
         if use_wikipedia:
-            service = WikipediaGenreService()
+            engine = GenreEnrichmentEngine()
             
-            for artist in data.get('items', []):
-                artist_name = artist.get('name')
+            for result in engine.enrich(data.get('items', [])):
+                artist = result['artist']
                 spotify_genres = artist.get('genres', [])
+                wiki_genres = result['wikipedia_genres']
                 
-                try:
-                    # Check if we have this artist in our database with genres
-                    db_artist = Artist.objects.filter(name__iexact=artist_name).first()
-                    
-                    if db_artist and db_artist.genres.exists():
-                        wiki_genres = [g.name for g in db_artist.genres.all()]
-                    else:
-                        # Try to fetch from Wikipedia
-                        wiki_genres = service.get_artist_genres(artist_name)
-                        
-                        # Store in database if we found genres
-                        if wiki_genres:
-                            if not db_artist:
-                                db_artist = Artist.objects.create(
-                                    name=artist_name,
-                                    spotify_id=artist.get('id')
-                                )
-                            service._store_genres(db_artist, wiki_genres)
-                    
-                    # Replace or supplement Spotify genres with Wikipedia genres
-                    if wiki_genres:
-                        artist['genres'] = wiki_genres  # Replace with Wikipedia genres
-                        artist['spotify_genres'] = spotify_genres  # Keep original Spotify genres for reference
-                        artist['genre_source'] = 'wikipedia'
-                    else:
-                        artist['genre_source'] = 'spotify'  # Fallback to Spotify genres
-                
-                except Exception as e:
-                    print(f"Failed to get Wikipedia genres for {artist_name}: {e}")
-                    artist['genre_source'] = 'spotify'  # Keep Spotify genres on error
-                    continue
+                # Replace or supplement Spotify genres with Wikipedia genres
+                if wiki_genres:
+                    artist['genres'] = wiki_genres  # Replace with Wikipedia genres
+                    artist['spotify_genres'] = spotify_genres  # Keep original Spotify genres for reference
+                    artist['genre_source'] = 'wikipedia'
+                else:
+                    artist['genre_source'] = 'spotify'  # Fallback to Spotify genres
         else:
             # Add source indicator for Spotify-only data
             for artist in data.get('items', []):
@@ -153,29 +139,39 @@ def top_genres(request):
     if cached_data:
         return Response(cached_data)
     
-    headers = {'Authorization': f'Bearer {user_token.access_token}'}
     params = {'limit': limit, 'time_range': time_range}
-    endpoint = 'https://api.spotify.com/v1/me/top/artists'
     
-    response = requests.get(endpoint, headers=headers, params=params)
+    try:
+        response = get_spotify_client().get('/me/top/artists', user_token.access_token, params=params)
+    except requests.RequestException:
+        return Response({"error": "Spotify did not respond"}, status=502)
     
     if response.status_code == 200:
         data = response.json()
-        spotify_genres = {}
-        wikipedia_genres = {}
-        artist_genre_map = {}
-        
-        # Track unique artists per genre (genre_name -> set of artist names)
-        artist_genre_counts = {}
-        
-        # Initialize Wikipedia service for normalization
-        if use_wikipedia:
-            service = WikipediaGenreService()
+        items = data.get('items', [])
+        engine = GenreEnrichmentEngine()
+        sources = [ArtistGenre.SPOTIFY]
+        
+        try:
+            # Spotify's genres are stored as assignments alongside Wikipedia's,
+            # so both sources are counted by the same database aggregation
+            db_artists = engine.store_spotify_genres(items)
+            if use_wikipedia:
+                engine.enrich(items, db_artists)
+                sources.append(ArtistGenre.WIKIPEDIA)
+            
+            artist_ids = {artist.id for artist in db_artists.values()}
+            stored_genres = ArtistGenre.objects.genres_by_artist(artist_ids, sources)
+            genres_by_source = ArtistGenre.objects.genre_counts_by_source(artist_ids, sources)
+            # Unique artists per genre, case-insensitive across sources
+            sorted_combined_genres = ArtistGenre.objects.genre_counts(artist_ids, sources)
+        except Exception as e:
+            return Response({"error": f"Failed to aggregate genres: {str(e)}"}, status=500)
         
-        # Process Spotify genres
-        for artist in data.get('items', []):
-            artist_name = artist.get('name')
-            artist_spotify_genres = artist.get('genres', [])
+        artist_genre_map = {}
+        for artist in items:
+            db_artist = db_artists.get(artist.get('id'))
+            artist_genres = stored_genres.get(db_artist.id, {}) if db_artist else {}
             
             # Get the largest image URL from Spotify
             image_url = ""
@@ -183,83 +179,24 @@ def top_genres(request):
             if images:
                 image_url = images[0].get('url', '')  # First image is usually the largest
             
-            # Store artist -> genres mapping (keep original case for display)
-            artist_genre_map[artist_name] = {
-                'spotify_genres': artist_spotify_genres,
-                'wikipedia_genres': [],
+            artist_genre_map[artist.get('name')] = {
+                'spotify_genres': artist_genres.get(ArtistGenre.SPOTIFY, []),
+                'wikipedia_genres': artist_genres.get(ArtistGenre.WIKIPEDIA, []),
                 'spotify_id': artist.get('id'),
                 'popularity': artist.get('popularity', 0),
                 'image_url': image_url
             }
-            
-            # Count Spotify genres (for separate tracking)
-            for genre in artist_spotify_genres:
-                spotify_genres[genre] = spotify_genres.get(genre, 0) + 1
-                
-                # Track unique artists per genre
-                genre_lower = genre.lower()
-                if genre_lower not in artist_genre_counts:
-                    artist_genre_counts[genre_lower] = set()
-                artist_genre_counts[genre_lower].add(artist_name)
-        
-        # If Wikipedia integration is enabled, get Wikipedia genres
-        if use_wikipedia:
-            for artist in data.get('items', []):
-                artist_name = artist.get('name')
-                
-                try:
-                    # Check if we have this artist in our database with genres
-                    db_artist = Artist.objects.filter(name__iexact=artist_name).first()
-                    
-                    if db_artist and db_artist.genres.exists():
-                        wiki_genres = [g.name for g in db_artist.genres.all()]
-                    else:
-                        # Try to fetch from Wikipedia
-                        wiki_genres = service.get_artist_genres(artist_name)
-                        
-                        # Store in database if we found genres
-                        if wiki_genres:
-                            if not db_artist:
-                                db_artist = Artist.objects.create(
-                                    name=artist_name,
-                                    spotify_id=artist.get('id')
-                                )
-                            service._store_genres(db_artist, wiki_genres)
-                    
-                    # Update our tracking
-                    if wiki_genres:
-                        artist_genre_map[artist_name]['wikipedia_genres'] = wiki_genres
-                        
-                        # Count Wikipedia genres (for separate tracking)
-                        for genre in wiki_genres:
-                            wikipedia_genres[genre] = wikipedia_genres.get(genre, 0) + 1
-                            
-                            # Track unique artists per genre
-                            genre_lower = genre.lower()
-                            if genre_lower not in artist_genre_counts:
-                                artist_genre_counts[genre_lower] = set()
-                            artist_genre_counts[genre_lower].add(artist_name)
-                
-                except Exception as e:
-                    print(f"Failed to get Wikipedia genres for {artist_name}: {e}")
-                    continue
-        
-        # Convert sets to unique artist counts
-        combined_genres = {genre: len(artists) for genre, artists in artist_genre_counts.items()}
-        
-        # Sort genres by unique artist count
-        sorted_combined_genres = sorted(combined_genres.items(), key=lambda x: x[1], reverse=True)
         
         # Format response to match frontend expectations
         response_data = {
             "genres": sorted_combined_genres,  # Now counts unique artists, not mentions
             "time_range": time_range,
             "total_unique_genres": len(sorted_combined_genres),
-            "total_artists_analyzed": len(data.get('items', [])),
+            "total_artists_analyzed": len(items),
             "artists_genre_map": artist_genre_map,
             # Keep additional data for debugging/future use
-            "spotify_genres": sorted(spotify_genres.items(), key=lambda x: x[1], reverse=True),
-            "wikipedia_genres": sorted(wikipedia_genres.items(), key=lambda x: x[1], reverse=True),
+            "spotify_genres": genres_by_source.get(ArtistGenre.SPOTIFY, []),
+            "wikipedia_genres": genres_by_source.get(ArtistGenre.WIKIPEDIA, []),
         }
         
         # Cache for 30 minutes
@@ -275,11 +212,12 @@ def get_artist(request, artist_name):
     if not user_token:
         return Response({"error": "No valid token found"}, status=401)
     
-    headers = {'Authorization': f'Bearer {user_token.access_token}'}
     params = {'q': f'artist:{artist_name}', 'type': 'artist', 'limit': 1}
-    endpoint = 'https://api.spotify.com/v1/search'
     
-    response = requests.get(endpoint, headers=headers, params=params)
+    try:
+        response = get_spotify_client().get('/search', user_token.access_token, params=params)
+    except requests.RequestException:
+        return Response({"error": "Spotify did not respond"}, status=502)
     
     if response.status_code == 200:
         data = response.json()
@@ -290,9 +228,34 @@ def get_artist(request, artist_name):
     else:
         return Response({"error": "Failed to fetch artist"}, status=response.status_code)
 
+def _search_spotify_artist(client, access_token, artist_name):
+    """Search Spotify for one artist by name; returns (artist or None, error message or None)."""
+    params = {
+        'q': f'artist:"{artist_name}"',
+        'type': 'artist',
+        'limit': 1
+    }
+    try:
+        response = client.get('/search', access_token, params=params)
+    except requests.RequestException as e:
+        return None, f"{type(e).__name__}: {str(e)}"
+    
+    if response.status_code != 200:
+        return None, f"Spotify search returned HTTP {response.status_code}"
+    try:
+        items = response.json()['artists']['items']
+    except (ValueError, KeyError, TypeError) as e:
+        return None, f"Unexpected search response: {str(e)}"
+    return (items[0] if items else None), None
+
 @api_view(['POST'])
 def get_artists_bulk_cached(request):
-    """Get multiple artists with Redis caching"""
+    """
+    Get multiple artists with Redis caching. Cached artists are read with one
+    get_many; the rest are searched concurrently (at most
+    SPOTIFY_SEARCH_CONCURRENCY at a time) and cached with one set_many.
+    Returns {'artists': {name: artist}, 'not_found': [names], 'failed': {name: reason}}.
+    """
     
     artist_names = request.data.get('artist_names', [])
     
@@ -313,51 +276,69 @@ def get_artists_bulk_cached(request):
         if not user_token:
             return Response({"error": "No valid token found"}, status=401)
         
-        headers = {'Authorization': f'Bearer {user_token.access_token}'}
+        client = get_spotify_client()
         
         unique_artists = list(dict.fromkeys(artist_names))
+        cache_keys = {
+            artist_name: f"spotify_artist:{hashlib.md5(artist_name.lower().encode()).hexdigest()}"
+            for artist_name in unique_artists
+        }
         artists_data = {}
-        uncached_artists = []
-        
-        # Check Redis cache first
+        not_found = []
+        failed = {}
+        
+        # Check Redis cache first, in one round trip
+        try:
+            cached = cache.get_many(list(set(cache_keys.values())))
+        except Exception as e:
+            logger.warning(f"Artist cache read failed, searching all {len(unique_artists)} artists: {str(e)}")
+            cached = {}
+        
+        # Names that differ only in case share a cache key and one search
+        uncached = {}
         for artist_name in unique_artists:
-            cache_key = f"spotify_artist:{hashlib.md5(artist_name.lower().encode()).hexdigest()}"
-            cached_data = cache.get(cache_key)
-            
-            if cached_data:
-                artists_data[artist_name] = cached_data
+            cache_key = cache_keys[artist_name]
+            if cached.get(cache_key):
+                artists_data[artist_name] = cached[cache_key]
             else:
-                uncached_artists.append(artist_name)
-        
-        # Fetch uncached artists from Spotify API
-        if uncached_artists:
-            for artist_name in uncached_artists:
+                uncached.setdefault(cache_key, []).append(artist_name)
+        
+        # Search uncached artists concurrently under a cap
+        if uncached:
+            searches = list(uncached.items())
+            results = run_concurrently(
+                lambda search: _search_spotify_artist(client, user_token.access_token, search[1][0]),
+                searches,
+                getattr(settings, 'SPOTIFY_SEARCH_CONCURRENCY', 8)
+            )
+            
+            to_cache = {}
+            for (cache_key, names), (artist, error) in zip(searches, results):
+                for artist_name in names:
+                    if error:
+                        failed[artist_name] = error
+                    elif artist:
+                        artists_data[artist_name] = artist
+                    else:
+                        not_found.append(artist_name)
+                if artist:
+                    to_cache[cache_key] = artist
+            
+            if to_cache:
+                # Cache in Redis for 1 hour
                 try:
-                    # Search for individual artist
-                    params = {
-                        'q': f'artist:"{artist_name}"',
-                        'type': 'artist',
-                        'limit': 1
-                    }
-                    
-                    response = requests.get('https://api.spotify.com/v1/search', 
-                                          headers=headers, params=params)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data['artists']['items']:
-                            artist = data['artists']['items'][0]
-                            artists_data[artist_name] = artist
-                            
-                            # Cache in Redis for 1 hour
-                            cache_key = f"spotify_artist:{hashlib.md5(artist_name.lower().encode()).hexdigest()}"
-                            cache.set(cache_key, artist, getattr(settings, 'ARTIST_CACHE_TIMEOUT', 3600))
-                    
+                    cache.set_many(to_cache, getattr(settings, 'ARTIST_CACHE_TIMEOUT', 3600))
                 except Exception as e:
-                    # If individual artist fails, continue with others
-                    continue
+                    logger.warning(f"Failed to cache {len(to_cache)} artists: {str(e)}")
         
-        return Response(artists_data)
+        if failed:
+            logger.warning(f"Spotify search failed for {len(failed)} of {len(unique_artists)} artists: {failed}")
+        
+        return Response({
+            'artists': artists_data,
+            'not_found': not_found,
+            'failed': failed,
+        })
         
     except Exception as e:
         return Response({"error": str(e)}, status=500)
@@ -388,7 +369,10 @@ def create_test_artists(request):
     
     created_artists = []
     for artist_name in test_artists:
-        artist, created = Artist.objects.get_or_create(name=artist_name)
+        artist, created = Artist.objects.get_or_create(
+            normalized_name=normalize_artist_name(artist_name),
+            defaults={'name': artist_name}
+        )
         if created:
             created_artists.append(artist.name)
     
@@ -407,12 +391,12 @@ def fetch_genres_for_artist(request, artist_id):
         genres = service.fetch_and_store_artist_genres(artist_id)
         
         # Get the stored genres
-        artist_genres = artist.genres.all()
+        artist.refresh_from_db(fields=['genre_names'])
         
         return Response({
             'artist': artist.name,
             'fetched_genres': genres,
-            'stored_genres': [g.name for g in artist_genres],
+            'stored_genres': artist.genre_names,
             'success': True
         })
     except Artist.DoesNotExist:
@@ -431,15 +415,16 @@ def fetch_all_genres(request):
     """Fetch genres for all artists without genres"""
     try:
         batch_size = request.data.get('batch_size', 5)
-        artists_without_genres = Artist.objects.filter(
-            artistgenre__isnull=True
-        ).distinct()[:batch_size]
+        artists_without_genres = Artist.objects.exclude(
+            artistgenre__source=ArtistGenre.WIKIPEDIA
+        )[:batch_size]
         
         service = WikipediaGenreService()
+        genres_by_artist = service.fetch_and_store_genres_for_artists(list(artists_without_genres))
         results = []
         
         for artist in artists_without_genres:
-            genres = service.fetch_and_store_artist_genres(artist.id)
+            genres = genres_by_artist.get(artist.id, [])
             results.append({
                 'artist': artist.name,
                 'genres_found': len(genres),
@@ -460,15 +445,15 @@ def fetch_all_genres(request):
 @api_view(['GET'])
 def list_artists_with_genres(request):
     """List all artists with their genres"""
-    artists = Artist.objects.prefetch_related('genres').all()
+    artists = Artist.objects.only('id', 'name', 'genre_names')
     
     data = []
     for artist in artists:
         data.append({
             'id': artist.id,
             'name': artist.name,
-            'genres': [g.name for g in artist.genres.all()],
-            'genre_count': artist.genres.count()
+            'genres': artist.genre_names,
+            'genre_count': len(artist.genre_names)
         })
     
     return Response({
@@ -476,13 +461,44 @@ def list_artists_with_genres(request):
         'artists': data
     })
 
+@api_view(['GET'])
+def artist_catalog(request):
+    """
+    Stream the artist catalog as NDJSON (one artist per line), ordered by id.
+    Keyset-paginated: pass ?after=<last id seen> to resume and ?limit=<n> to
+    cap a page. Rows come from a server-side cursor in fixed-size chunks, so
+    memory stays flat however large the catalog is.
+    """
+    try:
+        after = int(request.GET.get('after', 0))
+        limit = int(request.GET['limit']) if 'limit' in request.GET else None
+    except ValueError:
+        return Response({"error": "after and limit must be integers"}, status=400)
+    
+    artists = Artist.objects.filter(id__gt=after).order_by('id').values_list('id', 'name', 'genre_names')
+    if limit is not None:
+        artists = artists[:max(limit, 0)]
+    chunk_size = getattr(settings, 'ARTIST_CATALOG_CHUNK_SIZE', 1000)
+    
+    def rows():
+        for artist_id, name, genre_names in artists.iterator(chunk_size=chunk_size):
+            yield json.dumps({
+                'id': artist_id,
+                'name': name,
+                'genres': genre_names,
+                'genre_count': len(genre_names)
+            }) + '\n'
+    
+    return StreamingHttpResponse(rows(), content_type='application/x-ndjson')
+
 @api_view(['GET'])
 def music_stats(request):
     """Get statistics about artists and genres"""
-    total_artists = Artist.objects.count()
-    artists_with_genres = Artist.objects.filter(genres__isnull=False).distinct().count()
+    stats = MusicStats.objects.current()
+    total_artists = stats.total_artists
+    artists_with_genres = stats.artists_with_genres
     artists_without_genres = total_artists - artists_with_genres
-    total_genres = Genre.objects.count()
+    total_genres = stats.total_genres
     
     return Response({
         'total_artists': total_artists,
@@ -527,6 +543,8 @@ def debug_wikipedia(request, artist_name):
             # Also test the full get_artist_genres method
             full_result = service.get_artist_genres(artist_name)
             debug_info['full_service_result'] = full_result
+            debug_info['bytes_transferred'] = service.bytes_by_artist.get(artist_name, 0)
+            debug_info['lead_section_only'] = service.lead_section_only
             
         else:
             debug_info['error'] = 'No search results found'
@@ -565,12 +583,24 @@ def debug_genre_extraction(request, artist_name):
         # Test the full pipeline
         full_result = service.get_artist_genres(artist_name)
         debug_info['full_service_result'] = full_result
+        debug_info['bytes_transferred'] = service.bytes_by_artist.get(artist_name, 0)
         
         return Response(debug_info)
         
     except Exception as e:
         return Response({'error': str(e)})
     
+@api_view(['GET'])
+def nlp_model_status(request):
+    """Load time and memory of the NLP models in this worker process"""
+    from music.nlp_models import model_registry
+    return Response(model_registry.stats())
+
+@api_view(['GET'])
+def spotify_client_status(request):
+    """Spotify API call counts and latencies recorded by this worker process"""
+    return Response(get_spotify_client().stats())
+
 @api_view(['POST'])
 def clear_cache(request):
     """Clear all cache"""
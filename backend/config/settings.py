@@ -155,12 +155,104 @@ CACHES = {
     }
 }
 
+# Wikipedia response cache: on-disk and size-bounded by default, or Redis
+WIKIPEDIA_CACHE_BACKEND = os.environ.get('WIKIPEDIA_CACHE_BACKEND', 'file')
+
+if WIKIPEDIA_CACHE_BACKEND == 'redis':
+    CACHES['wikipedia'] = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/0'),
+        'KEY_PREFIX': 'wikipedia',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        }
+    }
+else:
+    CACHES['wikipedia'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('WIKIPEDIA_CACHE_DIR', os.path.join(BASE_DIR, '.cache', 'wikipedia')),
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,   # Oldest entries are culled past this
+            'CULL_FREQUENCY': 4,    # Cull a quarter of the entries at a time
+        }
+    }
+
+WIKIPEDIA_RESPONSE_CACHE = True
+WIKIPEDIA_CACHE_ALIAS = 'wikipedia'
+WIKIPEDIA_SEARCH_CACHE_TIMEOUT = 86400     # 1 day
+WIKIPEDIA_PAGE_CACHE_TIMEOUT = 604800      # 1 week
+WIKIPEDIA_REVALIDATE_AFTER = 3600          # Re-check page revids after 1 hour
+WIKIPEDIA_CACHE_MAX_ENTRY_BYTES = 524288   # Don't cache pages larger than 512 KB
+
 # Cache timeout for artist data (1 hour)
 ARTIST_CACHE_TIMEOUT = 3600    # 1 hour
 TRACKS_CACHE_TIMEOUT = 1800    # 30 minutes  
 ARTISTS_CACHE_TIMEOUT = 1800   # 30 minutes
 GENRES_CACHE_TIMEOUT = 1800    # 30 minutes
 
+# Spotify API client (spotify/client.py): (connect, read) timeouts in seconds, retries with
+# exponential backoff on connection errors and 5xx, keep-alive pool size per process, and
+# latency samples kept per endpoint (see /debug/spotify-client/)
+SPOTIFY_CONNECT_TIMEOUT = 3.05
+SPOTIFY_READ_TIMEOUT = 10
+SPOTIFY_MAX_RETRIES = 3
+SPOTIFY_RETRY_BACKOFF = 0.5
+SPOTIFY_POOL_MAXSIZE = 10
+SPOTIFY_LATENCY_SAMPLES = 500
+
+# Concurrent artist searches per /artists/bulk-cached/ request (kept below SPOTIFY_POOL_MAXSIZE)
+SPOTIFY_SEARCH_CONCURRENCY = 8
+
+# Download only the lead section (infobox) of Wikipedia pages
+WIKIPEDIA_LEAD_SECTION_ONLY = True
+
+# Concurrent genre enrichment: worker threads per request and in-flight requests per host
+ENRICHMENT_MAX_WORKERS = 8
+DEFAULT_HOST_CONCURRENCY = 4
+HOST_CONCURRENCY_LIMITS = {
+    'en.wikipedia.org': 4,
+}
+
+# Seconds between checks for genre blocklist/allowlist edits made by other processes
+TERM_MATCHER_RELOAD_INTERVAL = 60
+
+# Rows fetched per server-side cursor round trip by the streaming artist catalog
+ARTIST_CATALOG_CHUNK_SIZE = 1000
+
+# Seconds between checks for genre aliases added by other processes
+GENRE_ALIAS_RELOAD_INTERVAL = 60
+
+# Seconds between checks for Genre rows stored by other processes (added to the known-genre gazetteer)
+GAZETTEER_REFRESH_INTERVAL = 60
+
+# Confidence stored with each source's genre assignments (ArtistGenre.confidence)
+GENRE_SOURCE_CONFIDENCE = {
+    'spotify': 0.95,
+    'wikipedia': 0.85,
+}
+
+# Memoize genre validation verdicts in-process (LRU of this many strings) and in the database
+GENRE_VERDICT_STORE = True
+GENRE_VERDICT_LRU_SIZE = 10000
+
+# Suspicious genre strings are sent through spaCy and the zero-shot classifier in batches of this size
+GENRE_NLP_BATCH_SIZE = 32
+
+# NLP models used for genre validation, loaded once per process. Set NLP_WARMUP_ON_STARTUP=true
+# in web workers to load them when the app starts rather than on the first request that needs them.
+SPACY_MODEL_NAME = 'en_core_web_sm'
+GENRE_CLASSIFIER_MODEL = 'typeform/distilbert-base-uncased-mnli'
+# Classifier backend: 'pytorch', 'quantized' (dynamic int8) or 'onnx' (ONNX Runtime, needs optimum[onnxruntime]).
+# GENRE_CLASSIFIER_ONNX_PATH may point at a pre-exported model directory; otherwise it is exported on load.
+# Check verdict parity with `manage.py check_classifier_parity` before switching.
+GENRE_CLASSIFIER_BACKEND = os.getenv('GENRE_CLASSIFIER_BACKEND', 'pytorch')
+GENRE_CLASSIFIER_ONNX_PATH = os.getenv('GENRE_CLASSIFIER_ONNX_PATH', '')
+NLP_WARMUP_ON_STARTUP = os.getenv('NLP_WARMUP_ON_STARTUP', 'false').lower() == 'true'
+
+# Artists with no Wikipedia genres are retried after GENRE_MISS_TTL, doubling per miss up to the max
+GENRE_MISS_TTL = 86400         # 1 day
+GENRE_MISS_MAX_TTL = 2592000   # 30 days
+
 # Optional: Use Redis for sessions as well (better performance)
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
\ No newline at end of file
@@ -1,3 +1,23 @@
 from django.contrib import admin
+from .models import GenreAlias, GenreTerm, GenreVerdict
 
 # Register your models here.
+@admin.register(GenreTerm)
+class GenreTermAdmin(admin.ModelAdmin):
+    list_display = ['term', 'kind', 'created_at']
+    list_filter = ['kind']
+    search_fields = ['term']
+
+
+@admin.register(GenreVerdict)
+class GenreVerdictAdmin(admin.ModelAdmin):
+    list_display = ['text', 'accepted', 'stage', 'created_at']
+    list_filter = ['accepted', 'stage']
+    search_fields = ['text']
+
+
+@admin.register(GenreAlias)
+class GenreAliasAdmin(admin.ModelAdmin):
+    list_display = ['alias', 'genre', 'created_at']
+    search_fields = ['alias', 'genre__name']
+    raw_id_fields = ['genre']
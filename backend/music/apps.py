@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class MusicConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'music'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
+        
+        # Load the NLP models at startup instead of on the first suspicious genre
+        from django.conf import settings
+        if getattr(settings, 'NLP_WARMUP_ON_STARTUP', False):
+            from .nlp_models import model_registry
+            model_registry.warmup()
@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from django.conf import settings
+
+# Default number of in-flight requests allowed per upstream host
+DEFAULT_HOST_CONCURRENCY = 4
+
+
+class HostLimiter:
+    """Caps the number of concurrent requests made to each host, process-wide."""
+    
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = DEFAULT_HOST_CONCURRENCY):
+        self.limits = limits or {}
+        self.default_limit = default_limit
+        self._semaphores = {}
+        self._lock = threading.Lock()
+    
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                limit = self.limits.get(host, self.default_limit)
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+            return self._semaphores[host]
+    
+    @contextmanager
+    def limit(self, url: str):
+        """Hold one of the host's slots for the duration of the block."""
+        semaphore = self._semaphore(urlparse(url).netloc)
+        with semaphore:
+            yield
+
+
+host_limiter = HostLimiter(
+    limits=getattr(settings, 'HOST_CONCURRENCY_LIMITS', {}),
+    default_limit=getattr(settings, 'DEFAULT_HOST_CONCURRENCY', DEFAULT_HOST_CONCURRENCY),
+)
+
+
+def run_concurrently(func: Callable, items: Iterable, max_workers: int) -> List:
+    """Apply func to every item on a bounded thread pool, keeping input order."""
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,157 @@
+import logging
+from typing import Dict, List, Optional
+from .genre_aliases import canonicalize_genres
+from .genre_writer import write_artist_genres
+from .models import Artist, ArtistGenre, GenreLookupMiss, MusicStats, normalize_artist_name
+from .services import WikipediaGenreService
+
+logger = logging.getLogger(__name__)
+
+
+class GenreEnrichmentEngine:
+    """
+    Adds Wikipedia genres to a ranked list of Spotify artists.
+    Artists with stored genres are served from the database, and artists whose
+    last lookup found nothing are skipped until their backoff expires. The rest
+    are resolved together by the service, whose searches and page batches run on
+    a bounded thread pool under per-host limits. Database reads and writes
+    stay on the calling thread.
+    """
+    
+    def __init__(self, service: Optional[WikipediaGenreService] = None):
+        self.service = service or WikipediaGenreService()
+    
+    def store_spotify_genres(self, spotify_artists: List[dict]) -> Dict[str, Artist]:
+        """
+        Store the genres Spotify lists for each artist as spotify-source
+        assignments, creating missing Artist rows first; each step is one bulk
+        query. Returns {spotify id: Artist} for the stored artists, which
+        enrich() accepts so they are not looked up again.
+        """
+        db_artists = Artist.objects.resolve_spotify_artists(spotify_artists)
+        self._create_artists([a for a in spotify_artists if a.get('id') not in db_artists], db_artists)
+        
+        write_artist_genres(
+            {
+                db_artists[artist.get('id')]: canonicalize_genres(artist.get('genres', []))
+                for artist in spotify_artists if artist.get('id') in db_artists
+            },
+            source=ArtistGenre.SPOTIFY
+        )
+        return db_artists
+    
+    def enrich(self, spotify_artists: List[dict], db_artists: Optional[Dict[str, Artist]] = None) -> List[dict]:
+        """
+        Return one result per Spotify artist, in Spotify's rank order:
+        {'artist': <spotify artist>, 'wikipedia_genres': [...], 'source': 'database' | 'wikipedia' | 'miss' | None}
+        db_artists, {spotify id: Artist}, skips the lookup of stored artists.
+        """
+        results = []
+        missing = []
+        
+        # One query for every artist already stored, genres included
+        if db_artists is None:
+            try:
+                db_artists = Artist.objects.resolve_spotify_artists(spotify_artists)
+            except Exception as e:
+                logger.error(f"Failed to look up {len(spotify_artists)} artists: {str(e)}")
+                db_artists = {}
+        
+        for artist in spotify_artists:
+            result = {'artist': artist, 'wikipedia_genres': [], 'source': None}
+            results.append(result)
+            
+            db_artist = db_artists.get(artist.get('id'))
+            stored_genres = db_artist.genre_names if db_artist else []
+            if stored_genres:
+                result['wikipedia_genres'] = stored_genres
+                result['source'] = 'database'
+            else:
+                missing.append(result)
+        
+        # Skip artists we recently looked up without finding anything
+        if missing:
+            try:
+                backing_off = GenreLookupMiss.objects.pending_retry([r['artist'].get('id') for r in missing])
+            except Exception as e:
+                logger.error(f"Failed to read genre lookup misses: {str(e)}")
+                backing_off = set()
+            
+            for result in missing:
+                if result['artist'].get('id') in backing_off:
+                    result['source'] = 'miss'
+            missing = [r for r in missing if r['source'] != 'miss']
+        
+        if missing:
+            fetched = self.service.get_genres_for_artists([r['artist'].get('name') for r in missing])
+            misses = {}
+            found = []
+            
+            for result in missing:
+                artist = result['artist']
+                artist_name = artist.get('name')
+                wiki_genres = fetched.get(artist_name, [])
+                if not wiki_genres:
+                    # A failed search or page fetch is not evidence that there are no genres
+                    if artist_name not in self.service.failed_lookups:
+                        misses[artist.get('id')] = artist_name
+                    continue
+                found.append(result)
+                
+                result['wikipedia_genres'] = wiki_genres
+                result['source'] = 'wikipedia'
+            
+            # Store everything we found with a constant number of queries
+            if found:
+                try:
+                    self._store(found, db_artists)
+                except Exception as e:
+                    logger.error(f"Failed to store Wikipedia genres for {len(found)} artists: {str(e)}")
+            
+            try:
+                GenreLookupMiss.objects.record_misses(misses)
+                GenreLookupMiss.objects.clear([r['artist'].get('id') for r in found])
+            except Exception as e:
+                logger.error(f"Failed to update genre lookup misses: {str(e)}")
+        
+        return results
+    
+    def _create_artists(self, spotify_artists: List[dict], db_artists: dict) -> None:
+        """Bulk-create Artist rows for Spotify artists and add them to db_artists."""
+        new_artists = list({
+            artist.get('id'): Artist(
+                name=artist.get('name'),
+                normalized_name=normalize_artist_name(artist.get('name')),
+                spotify_id=artist.get('id')
+            )
+            for artist in spotify_artists if artist.get('id') and not db_artists.get(artist.get('id'))
+        }.values())
+        if new_artists:
+            # An artist renamed on Spotify keeps its row, matched by spotify_id
+            Artist.objects.bulk_create(
+                new_artists,
+                update_conflicts=True,
+                unique_fields=['spotify_id'],
+                update_fields=['name', 'normalized_name']
+            )
+            for db_artist in new_artists:
+                db_artists[db_artist.spotify_id] = db_artist
+            
+            # Rows that already existed were updated, not inserted, and keep their created_at
+            created = dict(Artist.objects.filter(id__in=[a.id for a in new_artists]).values_list('id', 'created_at'))
+            inserted = sum(created.get(db_artist.id) == db_artist.created_at for db_artist in new_artists)
+            MusicStats.objects.adjust(total_artists=inserted)
+    
+    def _store(self, found: List[dict], db_artists: dict) -> None:
+        """Create missing Artist rows, then store genres and page bindings in bulk."""
+        self._create_artists([r['artist'] for r in found], db_artists)
+        
+        genres_by_artist = {}
+        bindings = {}
+        for result in found:
+            db_artist = db_artists[result['artist'].get('id')]
+            genres_by_artist[db_artist] = result['wikipedia_genres']
+            bindings[db_artist] = self.service.page_bindings.get(result['artist'].get('name'))
+        
+        self.service._store_genres_for_artists(genres_by_artist)
+        self.service._store_page_bindings(bindings)
@@ -0,0 +1,106 @@
+import re
+from typing import Dict, Iterable, Optional
+from .reloadable import Reloadable, read_table
+
+# Curated genres accepted without NLP, on top of every stored Genre row
+SEED_GENRES = [
+    'Acid jazz', 'Afrobeat', 'Afrobeats', 'Alternative rock', 'Ambient', 'Americana', 'Art pop', 'Art rock',
+    'Bachata', 'Baroque pop', 'Bebop', 'Big band', 'Bluegrass', 'Blues', 'Bossa nova', 'Breakbeat', 'Britpop',
+    'Chamber pop', 'Chillwave', 'Cloud rap', 'Contemporary R&B', 'Country', 'Cumbia', 'Dancehall',
+    'Death metal', 'Disco', 'Dream pop', 'Drill', 'Drum and bass', 'Dub', 'Dubstep', 'EDM', 'Electro',
+    'Electropop', 'Emo', 'Eurodance', 'Flamenco', 'Folk', 'Folk rock', 'Freak folk', 'Funk', 'Garage rock',
+    'Glam rock', 'Gospel', 'Grime', 'Grunge', 'Hard rock', 'Hardcore punk', 'Heavy metal', 'Hip hop',
+    'House', 'Hyperpop', 'IDM', 'Indie folk', 'Indie pop', 'Indie rock', 'Industrial', 'J-pop', 'Jazz',
+    'Jazz fusion', 'Jungle', 'K-pop', 'Krautrock', 'Latin pop', 'Lo-fi', 'Math rock', 'Merengue', 'Motown',
+    'Neo soul', 'New wave', 'Noise rock', 'Nu metal', 'Phonk', 'Pop', 'Pop punk', 'Pop rap', 'Post-hardcore',
+    'Post-punk', 'Post-rock', 'Progressive rock', 'Psychedelic rock', 'Punk rock', 'R&B', 'Reggae',
+    'Reggaeton', 'Salsa', 'Shoegaze', 'Ska', 'Slowcore', 'Soft rock', 'Soul', 'Southern hip hop',
+    'Surf rock', 'Synth-pop', 'Synthwave', 'Tango', 'Techno', 'Trance', 'Trap', 'Trip hop', 'UK garage',
+    'Vaporwave', 'Zydeco',
+]
+
+# Variant spellings of seed genres
+SEED_ALIASES = {
+    'dnb': 'Drum and bass',
+    'drum n bass': 'Drum and bass',
+    'drum & bass': 'Drum and bass',
+    'rnb': 'R&B',
+    'rhythm and blues': 'R&B',
+    'hiphop': 'Hip hop',
+    'synthpop': 'Synth-pop',
+    'postpunk': 'Post-punk',
+    'lofi': 'Lo-fi',
+    'triphop': 'Trip hop',
+    'electronic dance music': 'EDM',
+}
+
+KEY_SEPARATORS = re.compile(r'[\s_\-]+')
+
+
+def gazetteer_key(text: str) -> str:
+    """Lookup key: lowercase, hyphens/underscores as spaces, without a trailing 'music'."""
+    key = KEY_SEPARATORS.sub(' ', text.lower()).strip()
+    if key.endswith(' music'):
+        key = key[:-len(' music')]
+    return key
+
+
+class GenreGazetteer:
+    """
+    Known genre names and aliases, mapped from their lookup key to the
+    canonical name. A hit is one key normalization plus one dict lookup.
+    """
+    
+    def __init__(self, genres: Iterable[str] = (), aliases: Optional[Dict[str, str]] = None):
+        self._canonical = {}
+        # Highest Genre id loaded, so refreshes only read newer rows
+        self.max_genre_id = 0
+        self.add(genres)
+        for alias, genre in (aliases or {}).items():
+            self._canonical.setdefault(gazetteer_key(alias), genre)
+    
+    def add(self, genres: Iterable[str]) -> None:
+        for genre in genres:
+            key = gazetteer_key(genre)
+            if key:
+                self._canonical.setdefault(key, genre)
+    
+    def lookup(self, text: str) -> Optional[str]:
+        """Canonical name of a known genre or alias, or None."""
+        return self._canonical.get(gazetteer_key(text))
+    
+    def __len__(self):
+        return len(self._canonical)
+
+
+def build_gazetteer() -> GenreGazetteer:
+    """The seed list plus every stored Genre row."""
+    gazetteer = GenreGazetteer(SEED_GENRES, SEED_ALIASES)
+    load_new_genres(gazetteer)
+    return gazetteer
+
+
+def load_new_genres(gazetteer: GenreGazetteer) -> None:
+    """Add Genre rows stored since the gazetteer last looked."""
+    from .models import Genre
+    rows = read_table(
+        lambda: list(Genre.objects.filter(id__gt=gazetteer.max_genre_id).values_list('id', 'name')),
+        [], 'seed genre gazetteer'
+    )
+    if rows:
+        gazetteer.add(name for _, name in rows)
+        gazetteer.max_genre_id = max(genre_id for genre_id, _ in rows)
+
+
+# Genres stored by any process are added every GAZETTEER_REFRESH_INTERVAL seconds
+_gazetteer = Reloadable(build_gazetteer, 'GAZETTEER_REFRESH_INTERVAL', refresh=load_new_genres)
+
+
+def get_gazetteer() -> GenreGazetteer:
+    """The process-wide gazetteer of known genres."""
+    return _gazetteer.get()
+
+
+def add_known_genres(genres: Iterable[str]) -> None:
+    """Add newly stored genres to this process's gazetteer right away."""
+    get_gazetteer().add(genres)
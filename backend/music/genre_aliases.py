@@ -0,0 +1,142 @@
+import re
+from typing import Dict, Iterable, List
+from .gazetteer import gazetteer_key
+from .reloadable import Reloadable, read_table
+
+# Built-in variant -> canonical spellings; GenreAlias rows add to and override these
+BUILTIN_ALIASES = {
+    # Capitalization fixes
+    'west coast hip-hop': 'West Coast hip hop',
+    'gangsta rap': 'gangster rap',
+    'political hip-hop': 'conscious hip hop',
+    
+    # R&B variations
+    'alternative r&b': 'alternative R&B',
+    'r&b': 'R&B',
+    'contemporary r&b': 'contemporary R&B',
+    'rhythm and blues': 'R&B',
+    
+    # Hip hop variations
+    'hip hop music': 'hip hop',
+    'hip-hop': 'hip hop',
+    'hiphop': 'hip hop',
+    
+    # Pop variations
+    'pop music': 'pop',
+    'popular music': 'pop',
+    
+    # Rock variations
+    'rock music': 'rock',
+    'rock and roll': 'rock',
+    'rock & roll': 'rock',
+    
+    # Electronic variations
+    'electronic music': 'electronic',
+    'electronica': 'electronic',
+    
+    # Jazz variations
+    'jazz music': 'jazz',
+    
+    # Folk variations
+    'folk music': 'folk',
+    'folk-rock': 'folk rock',
+    
+    # Soul variations
+    'soul music': 'soul',
+    'neo soul': 'neo-soul',
+    
+    # Other normalizations
+    'alternative hip-hop': 'alternative hip hop',
+    'southern hip-hop': 'Southern hip hop',
+}
+
+VERSION_CACHE_KEY = 'music:genre_alias_version'
+
+# Upper bound on memoized spellings that have no alias
+MAX_FORMATTED_ENTRIES = 50000
+
+
+def format_genre_name(genre: str) -> str:
+    """Standard display form of a genre name without an alias."""
+    genre = re.sub(r'[<>{}]', '', genre.strip())
+    
+    # Special case for R&B - keep capitalized
+    if 'r&b' in genre.lower():
+        return genre.replace('r&b', 'R&B').replace('R&b', 'R&B')
+    
+    # Special case for K-pop/K-rock - capitalize K
+    if genre.lower().startswith('k-'):
+        return 'K-' + genre[2:]
+    
+    # Title case for multi-word genres, lowercase for single words
+    if ' ' in genre:
+        return genre.title()
+    else:
+        return genre.lower()
+
+
+class GenreCanonicalizer:
+    """
+    Maps any spelling of a genre (Wikipedia or Spotify) to its canonical name.
+    Aliases are indexed by gazetteer_key, so case, hyphens and a trailing
+    'music' never need their own alias. Spellings without an alias are
+    formatted once and memoized, so repeat lookups are a single dict hit.
+    """
+    
+    def __init__(self, aliases: Dict[str, str]):
+        self._aliases = {gazetteer_key(alias): genre for alias, genre in aliases.items()}
+        self._formatted = {}
+    
+    def canonicalize(self, genre: str) -> str:
+        if not genre:
+            return ""
+        
+        canonical = self._formatted.get(genre)
+        if canonical is None:
+            canonical = self._aliases.get(gazetteer_key(genre)) or format_genre_name(genre)
+            if len(self._formatted) >= MAX_FORMATTED_ENTRIES:
+                self._formatted.clear()
+            self._formatted[genre] = canonical
+        return canonical
+
+
+def build_canonicalizer() -> GenreCanonicalizer:
+    """Built-in aliases plus the DB-managed GenreAlias rows."""
+    from .models import GenreAlias
+    aliases = {alias: format_genre_name(genre) for alias, genre in BUILTIN_ALIASES.items()}
+    aliases.update(read_table(
+        lambda: dict(GenreAlias.objects.values_list('alias', 'genre__name')), {}, 'built-in genre aliases'
+    ))
+    return GenreCanonicalizer(aliases)
+
+
+# Rebuilt when another process publishes a new alias version (checked every GENRE_ALIAS_RELOAD_INTERVAL seconds)
+_canonicalizer = Reloadable(build_canonicalizer, 'GENRE_ALIAS_RELOAD_INTERVAL', version_key=VERSION_CACHE_KEY)
+
+
+def get_canonicalizer() -> GenreCanonicalizer:
+    """The process-wide canonicalizer, picking up aliases added by other processes."""
+    return _canonicalizer.get()
+
+
+def reload_canonicalizer() -> None:
+    """Rebuild this process's aliases and tell the other processes to rebuild theirs."""
+    _canonicalizer.reload()
+
+
+def canonicalize_genre(genre: str) -> str:
+    """Canonical name of a genre string from any source."""
+    return get_canonicalizer().canonicalize(genre)
+
+
+def canonicalize_genres(genres: Iterable[str]) -> List[str]:
+    """Canonical names of several genres, deduplicated case-insensitively, in order."""
+    canonicalizer = get_canonicalizer()
+    results = []
+    seen = set()
+    for genre in genres:
+        canonical = canonicalizer.canonicalize(genre)
+        if canonical and canonical.lower() not in seen:
+            seen.add(canonical.lower())
+            results.append(canonical)
+    return results
@@ -0,0 +1,97 @@
+import logging
+from decimal import Decimal
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.db import transaction
+from .gazetteer import add_known_genres
+from .models import Artist, ArtistGenre, Genre, MusicStats
+
+logger = logging.getLogger(__name__)
+
+
+def source_confidence(source: str) -> Decimal:
+    """Confidence stored with genres from source (GENRE_SOURCE_CONFIDENCE)."""
+    confidences = getattr(settings, 'GENRE_SOURCE_CONFIDENCE', {})
+    return Decimal(str(confidences.get(source, 0.85))).quantize(Decimal('0.01'))
+
+
+def write_artist_genres(genres_by_artist: Dict[Artist, List[str]], source: str = ArtistGenre.WIKIPEDIA,
+                        confidence: Optional[Decimal] = None) -> None:
+    """
+    Replace the genres source assigns to many artists in a constant number of
+    queries: existing genres are read in one query and missing ones
+    bulk-inserted, then each artist's links from this source are diffed
+    against the new list. New links and links whose confidence changed go
+    through one bulk upsert; dropped links are deleted. Links from other
+    sources are left alone.
+    Wikipedia genres also update each artist's genre_names snapshot in the
+    same transaction. Genre names must already be canonical.
+    """
+    genres_by_artist = {artist: list(dict.fromkeys(g for g in genres if g)) for artist, genres in genres_by_artist.items()}
+    if not genres_by_artist:
+        return
+    
+    if confidence is None:
+        confidence = source_confidence(source)
+    names = {name for genres in genres_by_artist.values() for name in genres}
+    
+    with transaction.atomic():
+        genre_ids = dict(Genre.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = [name for name in names if name not in genre_ids]
+        if missing:
+            # Another writer may insert the same genre concurrently; re-read the ids.
+            # A row is ours when it carries the created_at stamped on our instance.
+            new_genres = {name: Genre(name=name) for name in missing}
+            Genre.objects.bulk_create(list(new_genres.values()), ignore_conflicts=True)
+            inserted = 0
+            for name, genre_id, created_at in Genre.objects.filter(name__in=missing).values_list('name', 'id', 'created_at'):
+                genre_ids[name] = genre_id
+                inserted += created_at == new_genres[name].created_at
+            add_known_genres(missing)
+            MusicStats.objects.adjust(total_genres=inserted)
+        
+        # Keyed by (artist id, genre id) in list order, so new links keep the source's order
+        wanted = list(dict.fromkeys(
+            (artist.id, genre_ids[name])
+            for artist, genres in genres_by_artist.items()
+            for name in genres
+        ))
+        current = {
+            (artist_id, genre_id): (link_id, link_confidence)
+            for link_id, artist_id, genre_id, link_confidence in ArtistGenre.objects.for_artists(
+                [artist.id for artist in genres_by_artist], [source]
+            ).values_list('id', 'artist_id', 'genre_id', 'confidence')
+        }
+        
+        wanted_keys = set(wanted)
+        stale = [link_id for key, (link_id, _) in current.items() if key not in wanted_keys]
+        if stale:
+            ArtistGenre.objects.filter(id__in=stale).delete()
+        
+        upserted = [
+            ArtistGenre(artist_id=artist_id, genre_id=genre_id, source=source, confidence=confidence)
+            for artist_id, genre_id in wanted
+            if (artist_id, genre_id) not in current or current[(artist_id, genre_id)][1] != confidence
+        ]
+        if upserted:
+            ArtistGenre.objects.bulk_create(
+                upserted,
+                update_conflicts=True,
+                unique_fields=['artist', 'genre', 'source'],
+                update_fields=['confidence']
+            )
+        
+        if source == ArtistGenre.WIKIPEDIA:
+            # Keep the denormalized snapshot on each artist row in step with the links
+            for artist, genres in genres_by_artist.items():
+                artist.genre_names = genres
+            Artist.objects.bulk_update(list(genres_by_artist), ['genre_names'])
+            
+            had_genres = {artist_id for artist_id, _ in current}
+            has_genres = {artist_id for artist_id, _ in wanted}
+            MusicStats.objects.adjust(artists_with_genres=len(has_genres - had_genres) - len(had_genres - has_genres))
+    
+    logger.info(
+        f"Stored {source} genres for {len(genres_by_artist)} artists "
+        f"({len(upserted)} links upserted, {len(stale)} removed)"
+    )
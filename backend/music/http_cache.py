@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import time
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+def _key_hash(value: str) -> str:
+    return hashlib.md5(value.encode('utf-8')).hexdigest()
+
+
+def normalize_query(query: str) -> str:
+    """Collapse case and whitespace so equivalent searches share a cache entry."""
+    return ' '.join(query.lower().split())
+
+
+class WikipediaResponseCache:
+    """
+    Caches MediaWiki responses in a Django cache alias (Redis or on-disk).
+    
+    - Search responses are keyed by the normalized query.
+    - Page wikitext is keyed by title, revision id and section, next to a small
+      per-title pointer holding the last seen revision id, page id and final
+      title. Once the pointer is
+      older than WIKIPEDIA_REVALIDATE_AFTER the caller re-checks the revid
+      (a content-free query) before serving the cached wikitext.
+    
+    Cache failures are logged and treated as misses.
+    """
+    
+    def __init__(self, alias: Optional[str] = None):
+        self.cache = caches[alias or getattr(settings, 'WIKIPEDIA_CACHE_ALIAS', 'wikipedia')]
+        self.search_timeout = getattr(settings, 'WIKIPEDIA_SEARCH_CACHE_TIMEOUT', 86400)
+        self.page_timeout = getattr(settings, 'WIKIPEDIA_PAGE_CACHE_TIMEOUT', 604800)
+        self.revalidate_after = getattr(settings, 'WIKIPEDIA_REVALIDATE_AFTER', 3600)
+        self.max_entry_bytes = getattr(settings, 'WIKIPEDIA_CACHE_MAX_ENTRY_BYTES', 512 * 1024)
+    
+    def _search_key(self, query: str) -> str:
+        return f"wiki:search:{_key_hash(normalize_query(query))}"
+    
+    def _pointer_key(self, title: str, section: Optional[int]) -> str:
+        return f"wiki:rev:{section}:{_key_hash(title)}"
+    
+    def _page_key(self, title: str, section: Optional[int], revid: int) -> str:
+        return f"wiki:page:{section}:{_key_hash(title)}:{revid}"
+    
+    def get_search(self, query: str):
+        try:
+            return self.cache.get(self._search_key(query))
+        except Exception as e:
+            logger.warning(f"Wikipedia cache read failed for search '{query}': {e}")
+            return None
+    
+    def set_search(self, query: str, data) -> None:
+        try:
+            self.cache.set(self._search_key(query), data, self.search_timeout)
+        except Exception as e:
+            logger.warning(f"Wikipedia cache write failed for search '{query}': {e}")
+    
+    def get_pages(self, titles: List[str], section: Optional[int]) -> Dict[str, dict]:
+        """
+        Return {title: {'pageid', 'title', 'revid', 'content', 'stale'}} for cached titles.
+        'stale' entries must have their revid re-checked before use.
+        """
+        try:
+            pointer_keys = {self._pointer_key(title, section): title for title in titles}
+            pointers = self.cache.get_many(list(pointer_keys))
+            if not pointers:
+                return {}
+            
+            page_keys = {
+                self._page_key(pointer_keys[key], section, pointer['revid']): (pointer_keys[key], pointer)
+                for key, pointer in pointers.items()
+            }
+            pages = self.cache.get_many(list(page_keys))
+        except Exception as e:
+            logger.warning(f"Wikipedia cache read failed for pages: {e}")
+            return {}
+        
+        now = time.time()
+        results = {}
+        for key, content in pages.items():
+            title, pointer = page_keys[key]
+            results[title] = {
+                'pageid': pointer.get('pageid'),
+                'title': pointer.get('title', title),
+                'revid': pointer['revid'],
+                'content': content,
+                'stale': now - pointer['checked_at'] > self.revalidate_after,
+            }
+        return results
+    
+    def _pointer(self, page: dict, checked_at: float) -> dict:
+        return {
+            'pageid': page.get('pageid'),
+            'title': page.get('title'),
+            'revid': page['revid'],
+            'checked_at': checked_at,
+        }
+    
+    def set_pages(self, pages: Dict[str, dict], section: Optional[int]) -> None:
+        """Store {title: {'pageid', 'title', 'revid', 'content'}} and point each title at that revision."""
+        now = time.time()
+        entries = {}
+        for title, page in pages.items():
+            if not page.get('revid') or len(page['content']) > self.max_entry_bytes:
+                continue
+            entries[self._page_key(title, section, page['revid'])] = page['content']
+            entries[self._pointer_key(title, section)] = self._pointer(page, now)
+        
+        if not entries:
+            return
+        try:
+            self.cache.set_many(entries, self.page_timeout)
+        except Exception as e:
+            logger.warning(f"Wikipedia cache write failed for pages: {e}")
+    
+    def mark_checked(self, pages: Dict[str, dict], section: Optional[int]) -> None:
+        """Record that each {title: page} revision was just confirmed current upstream."""
+        now = time.time()
+        entries = {
+            self._pointer_key(title, section): self._pointer(page, now)
+            for title, page in pages.items()
+        }
+        if not entries:
+            return
+        try:
+            self.cache.set_many(entries, self.page_timeout)
+        except Exception as e:
+            logger.warning(f"Wikipedia cache write failed for revision checks: {e}")
@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from music.management.commands.bench_startup import run_measured
+from music.management.commands.check_classifier_parity import load_candidates
+from music.nlp_models import CLASSIFIER_BACKENDS, classify_texts, load_genre_classifier
+import json
+import sys
+import time
+
+
+class Command(BaseCommand):
+    help = 'Benchmark genre classifier backends: load time, per-candidate latency and peak RSS'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backends',
+            nargs='*',
+            default=CLASSIFIER_BACKENDS,
+            help=f'Backends to benchmark (choices: {", ".join(CLASSIFIER_BACKENDS)})'
+        )
+        parser.add_argument(
+            '--candidates',
+            help='JSON file of [text, is_genre] pairs (defaults to the built-in set)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=getattr(settings, 'GENRE_NLP_BATCH_SIZE', 32),
+            help='Candidates per classifier call in the batched pass'
+        )
+        parser.add_argument(
+            '--measure',
+            help='Measure a single backend in this process and print JSON (used internally)'
+        )
+    
+    def handle(self, *args, **options):
+        if options['measure']:
+            self.stdout.write(json.dumps(self.measure(options['measure'], options)))
+            return
+        
+        # Peak RSS only grows, so each backend is measured in a fresh process
+        for backend in options['backends']:
+            command = [sys.executable, 'manage.py', 'bench_classifier', '--measure', backend,
+                       '--batch-size', str(options['batch_size'])]
+            if options['candidates']:
+                command += ['--candidates', options['candidates']]
+            
+            _, peak_rss, stdout, returncode = run_measured(command, str(settings.BASE_DIR))
+            if returncode != 0 or not stdout.strip():
+                self.stdout.write(self.style.ERROR(f'{backend:>10}: failed (exit {returncode})'))
+                continue
+            
+            result = json.loads(stdout.strip().splitlines()[-1])
+            self.stdout.write(
+                f'{backend:>10}: load {result["load_seconds"]:.2f}s, '
+                f'{result["single_ms"]:.1f} ms/candidate one at a time, '
+                f'{result["batched_ms"]:.1f} ms/candidate batched, '
+                f'{peak_rss:.0f} MB peak RSS'
+            )
+    
+    def measure(self, backend, options):
+        texts = [text for text, _ in load_candidates(options['candidates'])]
+        
+        start = time.perf_counter()
+        classifier = load_genre_classifier(backend)
+        load_seconds = time.perf_counter() - start
+        
+        # Warm up once so lazy initialization is not counted as latency
+        classify_texts(classifier, texts[:1])
+        
+        start = time.perf_counter()
+        for text in texts:
+            classify_texts(classifier, [text])
+        single = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        classify_texts(classifier, texts, options['batch_size'])
+        batched = time.perf_counter() - start
+        
+        return {
+            'load_seconds': load_seconds,
+            'single_ms': single / len(texts) * 1000,
+            'batched_ms': batched / len(texts) * 1000,
+        }
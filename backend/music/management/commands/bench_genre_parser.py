@@ -0,0 +1,114 @@
+from django.core.management.base import BaseCommand
+from music.wikitext import extract_infobox_genres
+import re
+import time
+
+# The regex path genre extraction used before music.wikitext
+LEGACY_GENRE_PATTERN = r'\|\s*genre\s*=\s*(.*?)(?=\n\s*\|[a-zA-Z_]|\n\}\}|\Z)'
+
+
+def legacy_extract_genres(content):
+    match = re.search(LEGACY_GENRE_PATTERN, content, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return None
+    
+    text = match.group(1).strip()
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'&[a-z]+;', '', text)
+    raw_links = re.findall(r'\[\[([^|\]\#]+)', text)
+    if raw_links:
+        return [link.strip() for link in raw_links]
+    return [part.strip() for part in re.split(r'[;,|/]', text) if part.strip()]
+
+
+def synthetic_page(body_paragraphs, with_genre=True):
+    """
+    A candidate page with a long body. Artist pages carry a referenced
+    flatlist genre field; other candidates (albums, places) have none, which
+    makes the regex path scan the whole page.
+    """
+    genre = (
+        "| genre = {{flatlist|\n"
+        "* [[Indie rock]]<ref>{{cite web|url=https://example.com|title=Review}}</ref>\n"
+        "* [[Hip hop music|hip hop]]\n"
+        "* [[Shoegaze]]<ref name=\"a\"/>\n"
+        "}}\n"
+    )
+    infobox = (
+        "{{Infobox musical artist\n"
+        "| name = Example <!-- comment | with pipe -->\n"
+        "| image = [[File:Example.jpg|thumb|Example | live]]\n"
+        + (genre if with_genre else "") +
+        "| label = {{hlist|[[Sub Pop]]|[[4AD]]}}\n"
+        "| website = {{URL|example.com}}\n"
+        "}}\n"
+    )
+    paragraph = (
+        "The band toured with [[Other Band|others]] in 2010.<ref>{{cite news|title=Tour|work=NME}}</ref> "
+        "{| class=\"wikitable\"\n| 2010 || Album || {{hlist|a|b}}\n|}\n"
+    )
+    return infobox + paragraph * body_paragraphs
+
+
+class Command(BaseCommand):
+    help = 'Benchmark infobox genre extraction: compiled single-pass parser vs the legacy regex path'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--titles',
+            nargs='*',
+            default=[],
+            help='Wikipedia page titles to benchmark (full pages); synthetic pages are used otherwise'
+        )
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=50,
+            help='Number of synthetic pages'
+        )
+        parser.add_argument(
+            '--body-paragraphs',
+            type=int,
+            default=2000,
+            help='Body size of each synthetic page, in paragraphs'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Timed passes over the page set'
+        )
+    
+    def handle(self, *args, **options):
+        if options['titles']:
+            from music.services import WikipediaGenreService
+            service = WikipediaGenreService(lead_section_only=False, response_cache=False)
+            contents = list(service._fetch_page_contents(options['titles']).values())
+        else:
+            contents = [
+                synthetic_page(options['body_paragraphs'], with_genre=i % 2 == 0)
+                for i in range(options['pages'])
+            ]
+        
+        if not contents:
+            self.stdout.write(self.style.ERROR('No pages to benchmark'))
+            return
+        
+        total_bytes = sum(len(content.encode('utf-8')) for content in contents)
+        self.stdout.write(f'{len(contents)} pages, {total_bytes / 1e6:.2f} MB per pass, {options["repeat"]} passes')
+        
+        for name, extract in [('legacy regex', legacy_extract_genres), ('single-pass parser', extract_infobox_genres)]:
+            start = time.perf_counter()
+            for _ in range(options['repeat']):
+                for content in contents:
+                    extract(content)
+            elapsed = time.perf_counter() - start
+            
+            pages = len(contents) * options['repeat']
+            self.stdout.write(
+                f'{name:>20}: {elapsed:.3f}s, {pages / elapsed:,.0f} pages/s, '
+                f'{total_bytes * options["repeat"] / elapsed / 1e6:,.1f} MB/s'
+            )
+        
+        agree = sum(legacy_extract_genres(content) == extract_infobox_genres(content) for content in contents)
+        self.stdout.write(f'Both paths agree on {agree}/{len(contents)} pages')
@@ -0,0 +1,110 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that should only be imported once the NLP path is used
+HEAVY_MODULES = ['torch', 'transformers', 'spacy']
+
+# Runs in a fresh interpreter: Django setup, URLconf import, then one request
+FIRST_REQUEST_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from django.conf import settings
+from django.urls import get_resolver
+get_resolver(settings.ROOT_URLCONF).url_patterns
+urls_done = time.perf_counter()
+from django.test import Client
+response = Client(raise_request_exception=False, HTTP_HOST='localhost').get(sys.argv[1])
+request_done = time.perf_counter()
+print(json.dumps({
+    'setup': setup_done - start,
+    'urlconf': urls_done - setup_done,
+    'first_request': request_done - urls_done,
+    'status': response.status_code,
+    'heavy_modules': [name for name in sys.argv[2:] if name in sys.modules],
+}))
+'''
+
+
+def run_measured(command, cwd):
+    """Run command to completion; return (wall seconds, peak RSS in MB, stdout, exit code)."""
+    start = time.perf_counter()
+    with subprocess.Popen(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as process:
+        stdout = process.stdout.read()
+        # Reap the child ourselves for its resource usage; with returncode set, leaving the block only closes the pipe
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - start
+    return elapsed, usage.ru_maxrss / 1024, stdout, process.returncode
+
+
+class Command(BaseCommand):
+    help = 'Benchmark backend startup: wall time and peak RSS of manage.py check, and cold first-request latency'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default='/test/music-stats/',
+            help='URL requested by the cold process'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Fresh processes per measurement (the median is reported)'
+        )
+    
+    def handle(self, *args, **options):
+        base_dir = str(settings.BASE_DIR)
+        repeat = max(options['repeat'], 1)
+        
+        check_runs = [
+            run_measured([sys.executable, 'manage.py', 'check'], base_dir)
+            for _ in range(repeat)
+        ]
+        failed = [run for run in check_runs if run[3] != 0]
+        if failed:
+            self.stdout.write(self.style.ERROR(f'manage.py check exited with {failed[0][3]}'))
+        self.stdout.write(
+            f'manage.py check: {statistics.median(run[0] for run in check_runs):.2f}s wall, '
+            f'{statistics.median(run[1] for run in check_runs):.0f} MB peak RSS'
+        )
+        
+        request_runs = []
+        for _ in range(repeat):
+            elapsed, rss, stdout, returncode = run_measured(
+                [sys.executable, '-c', FIRST_REQUEST_SCRIPT, options['path']] + HEAVY_MODULES,
+                base_dir
+            )
+            if returncode != 0 or not stdout.strip():
+                self.stdout.write(self.style.ERROR(f'Cold request process exited with {returncode}'))
+                return
+            timings = json.loads(stdout.strip().splitlines()[-1])
+            timings.update({'total': elapsed, 'rss': rss})
+            request_runs.append(timings)
+        
+        def median(key):
+            return statistics.median(run[key] for run in request_runs)
+        
+        last = request_runs[-1]
+        self.stdout.write(
+            f'cold GET {options["path"]} (HTTP {last["status"]}): {median("total"):.2f}s to response, '
+            f'{median("rss"):.0f} MB peak RSS'
+        )
+        self.stdout.write(
+            f'  django.setup {median("setup"):.2f}s, URLconf import {median("urlconf"):.2f}s, '
+            f'first request {median("first_request"):.2f}s'
+        )
+        heavy = last['heavy_modules']
+        if heavy:
+            self.stdout.write(self.style.WARNING(f'  heavy modules imported: {", ".join(heavy)}'))
+        else:
+            self.stdout.write(self.style.SUCCESS('  no heavy NLP modules imported'))
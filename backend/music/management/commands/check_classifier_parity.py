@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand, CommandError
+from music.nlp_models import (
+    CLASSIFIER_BACKENDS, PYTORCH_BACKEND, classify_texts, is_genre_classification, load_genre_classifier,
+)
+import json
+
+# Suspicious strings that reach the classifier in practice, labeled True for genres
+LABELED_GENRE_CANDIDATES = [
+    ('Shoegaze', True), ('Grime', True), ('Chillwave', True), ('Trip Hop', True),
+    ('Bossa Nova', True), ('Synthwave', True), ('Vaporwave', True), ('Afrobeat', True),
+    ('Grunge', True), ('Disco', True), ('Ska', True), ('Zydeco', True),
+    ('Flamenco', True), ('Cumbia', True), ('Bachata', True), ('Salsa', True),
+    ('Dub', True), ('Drill', True), ('Jungle', True), ('Lo-Fi', True),
+    ('Emo', True), ('Bebop', True), ('Motown', True), ('Neo Soul', True),
+    ('Pharrell', False), ('Kanye', False), ('Beyoncé', False), ('Drake', False),
+    ('Adele', False), ('Rihanna', False), ('Nashville', False), ('Tokyo', False),
+    ('London', False), ('Sweden', False), ('Spotify', False), ('Youtube', False),
+    ('Netflix', False), ('Coachella', False), ('Grammy', False), ('Gucci', False),
+]
+
+
+def load_candidates(path):
+    """[(text, is_genre)] from a JSON file of [text, is_genre] pairs, or the built-in set."""
+    if not path:
+        return LABELED_GENRE_CANDIDATES
+    with open(path) as f:
+        return [(text, bool(is_genre)) for text, is_genre in json.load(f)]
+
+
+class Command(BaseCommand):
+    help = 'Check that genre classifier backends reach the same verdicts as the PyTorch backend on a labeled candidate set'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backends',
+            nargs='*',
+            default=[b for b in CLASSIFIER_BACKENDS if b != PYTORCH_BACKEND],
+            help=f'Backends to compare against {PYTORCH_BACKEND} (choices: {", ".join(CLASSIFIER_BACKENDS)})'
+        )
+        parser.add_argument(
+            '--candidates',
+            help='JSON file of [text, is_genre] pairs (defaults to the built-in set)'
+        )
+        parser.add_argument(
+            '--min-agreement',
+            type=float,
+            default=1.0,
+            help='Fail when a backend agrees with the reference on fewer than this fraction of candidates'
+        )
+    
+    def handle(self, *args, **options):
+        candidates = load_candidates(options['candidates'])
+        texts = [text for text, _ in candidates]
+        
+        verdicts = {}
+        for backend in [PYTORCH_BACKEND] + [b for b in options['backends'] if b != PYTORCH_BACKEND]:
+            try:
+                classifier = load_genre_classifier(backend)
+            except Exception as e:
+                raise CommandError(f'Could not load the {backend} backend: {e}')
+            verdicts[backend] = [is_genre_classification(result) for result in classify_texts(classifier, texts)]
+            
+            correct = sum(verdict == label for verdict, (_, label) in zip(verdicts[backend], candidates))
+            self.stdout.write(f'{backend:>10}: {correct}/{len(candidates)} match the labels')
+        
+        failed = []
+        reference = verdicts[PYTORCH_BACKEND]
+        for backend, backend_verdicts in verdicts.items():
+            if backend == PYTORCH_BACKEND:
+                continue
+            mismatches = [text for text, ref, verdict in zip(texts, reference, backend_verdicts) if ref != verdict]
+            agreement = 1 - len(mismatches) / len(texts)
+            message = f'{backend} agrees with {PYTORCH_BACKEND} on {agreement:.1%} of verdicts'
+            if mismatches:
+                message += f' (differs on: {", ".join(mismatches)})'
+            
+            if agreement < options['min_agreement']:
+                failed.append(backend)
+                self.stdout.write(self.style.ERROR(message))
+            else:
+                self.stdout.write(self.style.SUCCESS(message))
+        
+        if failed:
+            raise CommandError(f'Verdict parity below {options["min_agreement"]:.0%} for: {", ".join(failed)}')
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from music.models import Artist, ArtistGenre
+
+
+class Command(BaseCommand):
+    help = 'Check that each artist\'s genre_names snapshot matches its Wikipedia ArtistGenre links'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Rewrite mismatched snapshots from the links'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Artists read per query'
+        )
+    
+    def handle(self, *args, **options):
+        linked = {}
+        for artist_id, genre_name in ArtistGenre.objects.filter(source=ArtistGenre.WIKIPEDIA).order_by('id').values_list('artist_id', 'genre__name').iterator(chunk_size=options['chunk_size']):
+            linked.setdefault(artist_id, []).append(genre_name)
+        
+        checked = 0
+        mismatched = []
+        for artist in Artist.objects.only('id', 'name', 'genre_names').iterator(chunk_size=options['chunk_size']):
+            checked += 1
+            expected = linked.get(artist.id, [])
+            # The snapshot keeps Wikipedia's order; the links only fix the set
+            if sorted(artist.genre_names) != sorted(expected):
+                mismatched.append((artist, expected))
+                self.stdout.write(f'{artist.name} (id {artist.id}): snapshot {artist.genre_names}, links {expected}')
+        
+        if not mismatched:
+            self.stdout.write(self.style.SUCCESS(f'All {checked} genre snapshots match their links'))
+            return
+        
+        self.stdout.write(self.style.WARNING(f'{len(mismatched)} of {checked} genre snapshots differ from their links'))
+        if options['fix']:
+            for artist, expected in mismatched:
+                # Keep the snapshot's order for genres that are still linked
+                kept = [name for name in artist.genre_names if name in expected]
+                artist.genre_names = kept + [name for name in expected if name not in kept]
+            Artist.objects.bulk_update([artist for artist, _ in mismatched], ['genre_names'], batch_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'Rewrote {len(mismatched)} genre snapshots'))
@@ -1,7 +1,6 @@
 from django.core.management.base import BaseCommand
-from music.models import Artist
+from music.models import Artist, ArtistGenre
 from music.services import WikipediaGenreService
-import time
 
 class Command(BaseCommand):
     help = 'Fetch genres from Wikipedia for artists'
@@ -18,6 +17,11 @@ class Command(BaseCommand):
             default=10,
             help='Number of artists to process in each batch'
         )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Re-check artists already bound to a Wikipedia page'
+        )
     
     def handle(self, *args, **options):
         service = WikipediaGenreService()
@@ -27,12 +31,22 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.SUCCESS(f'Found {len(genres)} genres')
             )
+            return
+        
+        if options['refresh']:
+            # Bound artists only need one revision check per 50 pages
+            artists = list(Artist.objects.filter(
+                wikipedia_page_id__isnull=False
+            )[:options['batch_size']])
         else:
-            artists_without_genres = Artist.objects.filter(
-                artistgenre__isnull=True
-            ).distinct()[:options['batch_size']]
-            
-            for artist in artists_without_genres:
-                genres = service.fetch_and_store_artist_genres(artist.id)
-                self.stdout.write(f'{artist.name}: {len(genres)} genres')
-                time.sleep(1)  # Be nice to Wikipedia
\ No newline at end of file
+            artists = list(Artist.objects.exclude(
+                artistgenre__source=ArtistGenre.WIKIPEDIA
+            )[:options['batch_size']])
+        
+        # Candidate pages for the whole batch are fetched together
+        genres_by_artist = service.fetch_and_store_genres_for_artists(artists)
+        
+        for artist in artists:
+            genres = genres_by_artist.get(artist.id, [])
+            bytes_transferred = service.bytes_by_artist.get(artist.name, 0)
+            self.stdout.write(f'{artist.name}: {len(genres)} genres ({bytes_transferred} bytes)')
\ No newline at end of file
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from music.models import MusicStats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the incrementally maintained music statistics from the catalog tables'
+    
+    def handle(self, *args, **options):
+        before = MusicStats.objects.filter(pk=MusicStats.objects.STATS_ID).first()
+        after = MusicStats.objects.reconcile()
+        
+        fields = ['total_artists', 'artists_with_genres', 'total_genres']
+        for field in fields:
+            old = getattr(before, field) if before else None
+            new = getattr(after, field)
+            drift = f' (was {old})' if old is not None and old != new else ''
+            self.stdout.write(f'{field}: {new}{drift}')
+        self.stdout.write(self.style.SUCCESS('Music statistics reconciled'))
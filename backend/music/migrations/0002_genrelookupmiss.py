@@ -0,0 +1,24 @@
+# Generated by Django 5.1 on 2026-10-17 01:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreLookupMiss',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('spotify_id', models.CharField(max_length=50, unique=True)),
+                ('artist_name', models.CharField(max_length=200)),
+                ('attempts', models.PositiveIntegerField(default=1)),
+                ('last_attempt_at', models.DateTimeField()),
+                ('retry_after', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
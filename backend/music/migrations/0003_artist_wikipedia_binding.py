@@ -0,0 +1,28 @@
+# Generated by Django 5.1 on 2026-10-17 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0002_genrelookupmiss'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artist',
+            name='wikipedia_page_id',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='artist',
+            name='wikipedia_revid',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='artist',
+            name='wikipedia_title',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+    ]
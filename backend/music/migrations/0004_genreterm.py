@@ -0,0 +1,25 @@
+# Generated by Django 5.1 on 2026-10-17 01:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0003_artist_wikipedia_binding'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('kind', models.CharField(choices=[('block', 'Blocklist (reject candidates containing this term)'), ('allow', 'Allowlist (accept candidates containing this term without NLP)')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('term', 'kind')},
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0004_genreterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreVerdict',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.CharField(max_length=100, unique=True)),
+                ('accepted', models.BooleanField()),
+                ('stage', models.CharField(max_length=20)),
+                ('scores', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1 on 2026-10-17 01:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0005_genreverdict'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('genre', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='music.genre')),
+            ],
+            options={
+                'verbose_name_plural': 'genre aliases',
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1 on 2026-10-17 01:57
+
+import re
+
+from django.db import migrations, models
+
+
+def normalize_artist_name(name):
+    # Frozen copy of music.models.normalize_artist_name
+    name = (name or '').casefold().strip()
+    if name.startswith('the '):
+        name = name[4:]
+    name = re.sub(r'[^\w\s]', '', name)
+    return ' '.join(name.split())
+
+
+def fill_normalized_names(apps, schema_editor):
+    Artist = apps.get_model('music', 'Artist')
+    batch = []
+    for artist in Artist.objects.only('id', 'name').iterator(chunk_size=1000):
+        artist.normalized_name = normalize_artist_name(artist.name)
+        batch.append(artist)
+        if len(batch) >= 1000:
+            Artist.objects.bulk_update(batch, ['normalized_name'])
+            batch = []
+    if batch:
+        Artist.objects.bulk_update(batch, ['normalized_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0006_genrealias'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artist',
+            name='normalized_name',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=200),
+        ),
+        migrations.RunPython(fill_normalized_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1 on 2026-10-17 01:57
+
+from django.db import migrations, models
+
+
+def fill_genre_names(apps, schema_editor):
+    Artist = apps.get_model('music', 'Artist')
+    ArtistGenre = apps.get_model('music', 'ArtistGenre')
+    names = {}
+    for artist_id, genre_name in ArtistGenre.objects.order_by('id').values_list('artist_id', 'genre__name').iterator(chunk_size=2000):
+        names.setdefault(artist_id, []).append(genre_name)
+    
+    batch = []
+    for artist in Artist.objects.filter(id__in=list(names)).only('id').iterator(chunk_size=1000):
+        artist.genre_names = names[artist.id]
+        batch.append(artist)
+        if len(batch) >= 1000:
+            Artist.objects.bulk_update(batch, ['genre_names'])
+            batch = []
+    if batch:
+        Artist.objects.bulk_update(batch, ['genre_names'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0007_artist_normalized_name'),
+    ]
+    
+    operations = [
+        migrations.AddField(
+            model_name='artist',
+            name='genre_names',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(fill_genre_names, migrations.RunPython.noop),
+    ]
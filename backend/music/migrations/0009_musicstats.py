@@ -0,0 +1,26 @@
+# Generated by Django 5.1 on 2026-10-17 01:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0008_artist_genre_names'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MusicStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_artists', models.IntegerField(default=0)),
+                ('artists_with_genres', models.IntegerField(default=0)),
+                ('total_genres', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name_plural': 'music stats',
+            },
+        ),
+    ]
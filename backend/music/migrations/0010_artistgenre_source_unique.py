@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-17 02:01
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0009_musicstats'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='artistgenre',
+            unique_together={('artist', 'genre', 'source')},
+        ),
+    ]
@@ -1,4 +1,9 @@
-from django.db import models
+import re
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
 
 class Genre(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -10,22 +15,310 @@ class Genre(models.Model):
     class Meta:
         ordering = ['name']
 
+def normalize_artist_name(name: str) -> str:
+    """
+    Matching key for artist names: casefolded, without a leading "The ",
+    punctuation removed and whitespace collapsed (the same variants the
+    Wikipedia search tries).
+    """
+    name = (name or '').casefold().strip()
+    if name.startswith('the '):
+        name = name[4:]
+    name = re.sub(r'[^\w\s]', '', name)
+    return ' '.join(name.split())
+
+class ArtistManager(models.Manager):
+    def resolve_spotify_artists(self, spotify_artists) -> dict:
+        """
+        Match Spotify artist dicts to Artist rows in one query; their genres
+        are on the row (genre_names). Artists are matched by spotify_id first, then by
+        normalized name among rows not yet bound to a Spotify artist; a row
+        matched by name is bound to that spotify_id. Returns {spotify id: Artist}
+        for the matches.
+        """
+        ids = [a.get('id') for a in spotify_artists if a.get('id')]
+        names = {normalize_artist_name(a.get('name')) for a in spotify_artists} - {''}
+        if not ids and not names:
+            return {}
+        
+        rows = list(
+            self.filter(
+                models.Q(spotify_id__in=ids) | models.Q(spotify_id__isnull=True, normalized_name__in=names)
+            ).order_by('id')
+        )
+        by_spotify_id = {artist.spotify_id: artist for artist in rows if artist.spotify_id}
+        by_name = {}
+        for artist in rows:
+            if artist.spotify_id is None:
+                by_name.setdefault(artist.normalized_name, artist)
+        
+        resolved = {}
+        for spotify_artist in spotify_artists:
+            spotify_id = spotify_artist.get('id')
+            if not spotify_id:
+                continue
+            artist = by_spotify_id.get(spotify_id)
+            if artist is None:
+                # Each unbound row can be claimed by one Spotify artist only
+                artist = by_name.pop(normalize_artist_name(spotify_artist.get('name')), None)
+                if artist is not None and not self._bind_spotify_id(artist, spotify_id):
+                    artist = None
+            if artist:
+                by_spotify_id[spotify_id] = artist
+                resolved[spotify_id] = artist
+        return resolved
+    
+    def _bind_spotify_id(self, artist, spotify_id: str) -> bool:
+        """Set spotify_id on a row matched by name, unless another process bound it first."""
+        try:
+            with transaction.atomic():
+                bound = self.filter(id=artist.id, spotify_id__isnull=True).update(spotify_id=spotify_id)
+        except IntegrityError:
+            # The spotify_id was stored on another row meanwhile
+            return False
+        if bound:
+            artist.spotify_id = spotify_id
+        return bool(bound)
+
 class Artist(models.Model):
     name = models.CharField(max_length=200)
+    # normalize_artist_name(name), indexed for lookups; kept in sync by save()
+    normalized_name = models.CharField(max_length=200, blank=True, default='', db_index=True)
     spotify_id = models.CharField(max_length=50, blank=True, null=True, unique=True)
     genres = models.ManyToManyField(Genre, through='ArtistGenre', blank=True)
+    # Ordered Wikipedia genre names, a copy of the wikipedia-source ArtistGenre
+    # links written with them so reads need no join; see check_genre_snapshots
+    genre_names = models.JSONField(default=list, blank=True)
+    # Wikipedia page the genres were resolved from, so refreshes can skip searching
+    wikipedia_page_id = models.PositiveIntegerField(blank=True, null=True)
+    wikipedia_title = models.CharField(max_length=255, blank=True, default='')
+    wikipedia_revid = models.PositiveBigIntegerField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ArtistManager()
+    
+    def save(self, *args, **kwargs):
+        self.normalized_name = normalize_artist_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'normalized_name'}
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return self.name
 
+class ArtistGenreManager(models.Manager):
+    def for_artists(self, artist_ids, sources=None):
+        """Links of the given artists, optionally only from some sources."""
+        links = self.filter(artist_id__in=artist_ids)
+        if sources is not None:
+            links = links.filter(source__in=sources)
+        return links
+    
+    def genre_counts(self, artist_ids, sources=None) -> list:
+        """
+        [(lowercase genre name, distinct artists)] over the given artists'
+        assignments from any of the sources, most common first.
+        """
+        return list(
+            self.for_artists(artist_ids, sources)
+            .annotate(name=Lower('genre__name'))
+            .values('name')
+            .annotate(artists=models.Count('artist', distinct=True))
+            .order_by('-artists', 'name')
+            .values_list('name', 'artists')
+        )
+    
+    def genre_counts_by_source(self, artist_ids, sources=None) -> dict:
+        """{source: [(genre name, artists)]} for the given artists, most common first."""
+        counts = {}
+        rows = (
+            self.for_artists(artist_ids, sources)
+            .values('source', 'genre__name')
+            .annotate(artists=models.Count('artist', distinct=True))
+            .order_by('-artists', 'genre__name')
+            .values_list('source', 'genre__name', 'artists')
+        )
+        for source, name, artists in rows:
+            counts.setdefault(source, []).append((name, artists))
+        return counts
+    
+    def genres_by_artist(self, artist_ids, sources=None) -> dict:
+        """{artist id: {source: [genre names in the order they were stored]}}"""
+        genres = {}
+        rows = self.for_artists(artist_ids, sources).order_by('id').values_list('artist_id', 'source', 'genre__name')
+        for artist_id, source, name in rows:
+            genres.setdefault(artist_id, {}).setdefault(source, []).append(name)
+        return genres
+
 class ArtistGenre(models.Model):
+    """One genre assigned to an artist by one source; a genre may come from several sources."""
+    WIKIPEDIA = 'wikipedia'
+    SPOTIFY = 'spotify'
+    
     artist = models.ForeignKey(Artist, on_delete=models.CASCADE)
     genre = models.ForeignKey(Genre, on_delete=models.CASCADE)
-    source = models.CharField(max_length=50, default='wikipedia')
+    source = models.CharField(max_length=50, default=WIKIPEDIA)
     confidence = models.DecimalField(max_digits=3, decimal_places=2, default=0.85)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = ArtistGenreManager()
+    
+    class Meta:
+        unique_together = ['artist', 'genre', 'source']
+
+def genre_miss_backoff(attempts: int) -> timedelta:
+    """How long to wait before retrying an artist after `attempts` empty lookups."""
+    base = getattr(settings, 'GENRE_MISS_TTL', 86400)
+    cap = getattr(settings, 'GENRE_MISS_MAX_TTL', 2592000)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), cap))
+
+class GenreLookupMissManager(models.Manager):
+    def pending_retry(self, spotify_ids):
+        """Spotify ids whose last lookup found nothing and are still backing off."""
+        spotify_ids = [s for s in spotify_ids if s]
+        if not spotify_ids:
+            return set()
+        return set(self.filter(
+            spotify_id__in=spotify_ids,
+            retry_after__gt=timezone.now()
+        ).values_list('spotify_id', flat=True))
+    
+    def record_misses(self, artists):
+        """Record an empty lookup for each {spotify_id: artist_name}, growing the backoff."""
+        artists = {spotify_id: name for spotify_id, name in artists.items() if spotify_id}
+        if not artists:
+            return
+        
+        now = timezone.now()
+        attempts = dict(self.filter(spotify_id__in=artists).values_list('spotify_id', 'attempts'))
+        misses = []
+        for spotify_id, name in artists.items():
+            count = attempts.get(spotify_id, 0) + 1
+            misses.append(self.model(
+                spotify_id=spotify_id,
+                artist_name=name[:200],
+                attempts=count,
+                last_attempt_at=now,
+                retry_after=now + genre_miss_backoff(count)
+            ))
+        
+        self.bulk_create(
+            misses,
+            update_conflicts=True,
+            unique_fields=['spotify_id'],
+            update_fields=['artist_name', 'attempts', 'last_attempt_at', 'retry_after']
+        )
+    
+    def clear(self, spotify_ids):
+        """Forget misses for artists that now have genres."""
+        spotify_ids = [s for s in spotify_ids if s]
+        if spotify_ids:
+            self.filter(spotify_id__in=spotify_ids).delete()
+
+class GenreLookupMiss(models.Model):
+    """An artist whose Wikipedia lookup found no genres, kept so it is not searched again until retry_after."""
+    spotify_id = models.CharField(max_length=50, unique=True)
+    artist_name = models.CharField(max_length=200)
+    attempts = models.PositiveIntegerField(default=1)
+    last_attempt_at = models.DateTimeField()
+    retry_after = models.DateTimeField(db_index=True)
+    
+    objects = GenreLookupMissManager()
+    
+    def __str__(self):
+        return f"{self.artist_name} (retry after {self.retry_after})"
+
+class GenreTerm(models.Model):
+    """DB-managed additions to the genre validation term lists."""
+    BLOCK = 'block'
+    ALLOW = 'allow'
+    KIND_CHOICES = [
+        (BLOCK, 'Blocklist (reject candidates containing this term)'),
+        (ALLOW, 'Allowlist (accept candidates containing this term without NLP)'),
+    ]
+    
+    term = models.CharField(max_length=100)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.term} ({self.kind})"
+    
+    class Meta:
+        unique_together = ['term', 'kind']
+
+class GenreVerdict(models.Model):
+    """
+    The memoized outcome of validating one candidate genre string, shared by
+    every process. Rows are cleared whenever the genre term lists change.
+    """
+    text = models.CharField(max_length=100, unique=True)
+    accepted = models.BooleanField()
+    stage = models.CharField(max_length=20)
+    scores = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.text}: {'accepted' if self.accepted else 'rejected'} ({self.stage})"
+
+class GenreAlias(models.Model):
+    """A variant spelling of a genre, mapped to its canonical Genre row."""
+    alias = models.CharField(max_length=100, unique=True)
+    genre = models.ForeignKey(Genre, on_delete=models.CASCADE, related_name='aliases')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.alias} -> {self.genre.name}"
+    
+    class Meta:
+        verbose_name_plural = 'genre aliases'
+
+class MusicStatsManager(models.Manager):
+    STATS_ID = 1
+    
+    def current(self):
+        """The stats row, computed from scratch the first time."""
+        stats = self.filter(pk=self.STATS_ID).first()
+        return stats or self.reconcile()
+    
+    def adjust(self, **deltas):
+        """Apply counter deltas, e.g. adjust(total_artists=1), in one UPDATE."""
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        updated = self.filter(pk=self.STATS_ID).update(
+            updated_at=timezone.now(),
+            **{field: models.F(field) + delta for field, delta in deltas.items()}
+        )
+        if not updated:
+            self.reconcile()
+    
+    def reconcile(self):
+        """Recompute every counter from the catalog tables."""
+        stats, _ = self.update_or_create(pk=self.STATS_ID, defaults={
+            'total_artists': Artist.objects.count(),
+            'artists_with_genres': Artist.objects.filter(artistgenre__source=ArtistGenre.WIKIPEDIA).distinct().count(),
+            'total_genres': Genre.objects.count(),
+            'updated_at': timezone.now(),
+        })
+        return stats
+
+class MusicStats(models.Model):
+    """
+    Catalog counters kept up to date by the artist and genre write paths (a
+    single row). artists_with_genres counts artists with Wikipedia genres.
+    """
+    total_artists = models.IntegerField(default=0)
+    artists_with_genres = models.IntegerField(default=0)
+    total_genres = models.IntegerField(default=0)
+    updated_at = models.DateTimeField()
+    
+    objects = MusicStatsManager()
+    
+    def __str__(self):
+        return f"{self.total_artists} artists, {self.artists_with_genres} with genres, {self.total_genres} genres"
+    
     class Meta:
-        unique_together = ['artist', 'genre']
\ No newline at end of file
+        verbose_name_plural = 'music stats'
\ No newline at end of file
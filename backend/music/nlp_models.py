@@ -0,0 +1,179 @@
+import logging
+import os
+import resource
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = 'spacy'
+GENRE_CLASSIFIER = 'genre_classifier'
+
+
+def process_rss_mb() -> Optional[float]:
+    """Current resident set size of this process in MB, where /proc is available."""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# spaCy and transformers (which pulls in torch) take seconds and hundreds of MB
+# to import, so they are imported only when a model is actually loaded
+def load_spacy_model():
+    import spacy
+    return spacy.load(getattr(settings, 'SPACY_MODEL_NAME', 'en_core_web_sm'))
+
+
+# Zero-shot classifier backends: the PyTorch pipeline, the same model with its
+# Linear layers dynamically quantized to int8, or an ONNX Runtime export
+PYTORCH_BACKEND = 'pytorch'
+QUANTIZED_BACKEND = 'quantized'
+ONNX_BACKEND = 'onnx'
+CLASSIFIER_BACKENDS = [PYTORCH_BACKEND, QUANTIZED_BACKEND, ONNX_BACKEND]
+
+GENRE_CANDIDATE_LABELS = [
+    "music genre",
+    "person name", 
+    "company name",
+    "website name",
+    "band name"
+]
+
+
+def load_genre_classifier(backend: Optional[str] = None):
+    """Zero-shot classification pipeline on the configured (or given) backend."""
+    from transformers import pipeline
+    model_name = getattr(settings, 'GENRE_CLASSIFIER_MODEL', 'typeform/distilbert-base-uncased-mnli')
+    backend = backend or getattr(settings, 'GENRE_CLASSIFIER_BACKEND', PYTORCH_BACKEND)
+    
+    if backend == PYTORCH_BACKEND:
+        # Use a lightweight model for better performance
+        return pipeline("zero-shot-classification", model=model_name)
+    
+    if backend == QUANTIZED_BACKEND:
+        import torch
+        classifier = pipeline("zero-shot-classification", model=model_name)
+        classifier.model = torch.quantization.quantize_dynamic(classifier.model, {torch.nn.Linear}, dtype=torch.qint8)
+        return classifier
+    
+    if backend == ONNX_BACKEND:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer
+        # Load a pre-exported model when configured, otherwise export on load
+        onnx_path = getattr(settings, 'GENRE_CLASSIFIER_ONNX_PATH', '')
+        if onnx_path:
+            model = ORTModelForSequenceClassification.from_pretrained(onnx_path)
+        else:
+            model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(onnx_path or model_name)
+        return pipeline("zero-shot-classification", model=model, tokenizer=tokenizer)
+    
+    raise ValueError(f"Unknown genre classifier backend '{backend}' (expected one of {CLASSIFIER_BACKENDS})")
+
+
+def classify_texts(classifier, texts: List[str], batch_size: int = 32) -> List[dict]:
+    """Zero-shot results for texts against GENRE_CANDIDATE_LABELS, one per text."""
+    results = classifier(texts, GENRE_CANDIDATE_LABELS, batch_size=batch_size)
+    if isinstance(results, dict):
+        results = [results]
+    return results
+
+
+def is_genre_classification(result: dict) -> bool:
+    """Decide from one zero-shot result whether the text is a music genre."""
+    # If "music genre" is the top prediction with decent confidence
+    if (result['labels'][0] == "music genre" and 
+        result['scores'][0] > 0.5):  # Increased threshold
+        return True
+    
+    # Also accept if music genre is second but close to first
+    if (len(result['labels']) > 1 and 
+        result['labels'][1] == "music genre" and
+        result['scores'][1] > 0.4 and
+        result['scores'][0] - result['scores'][1] < 0.2):
+        return True
+    
+    return False
+
+
+class ModelRegistry:
+    """
+    Loads each NLP model once per process and shares it between all service
+    instances. A model that fails to load is remembered as unavailable (False)
+    so callers fall back without retrying on every request.
+    Load time and the RSS growth during loading are recorded per model.
+    """
+    
+    def __init__(self, loaders: Dict[str, Callable]):
+        self._loaders = loaders
+        self._models = {}
+        self._stats = {}
+        self._locks = {name: threading.Lock() for name in loaders}
+    
+    def get(self, name: str):
+        """The loaded model, or False when it is unavailable."""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        
+        with self._locks[name]:
+            if name not in self._models:
+                self._models[name] = self._load(name)
+            return self._models[name]
+    
+    def _load(self, name: str):
+        rss_before = process_rss_mb()
+        start = time.perf_counter()
+        try:
+            model = self._loaders[name]()
+            error = None
+        except Exception as e:
+            logger.warning(f"Could not load NLP model '{name}': {e}")
+            model = False
+            error = str(e)
+        
+        elapsed = time.perf_counter() - start
+        rss_after = process_rss_mb()
+        self._stats[name] = {
+            'loaded': model is not False,
+            'load_seconds': round(elapsed, 3),
+            'rss_delta_mb': round(rss_after - rss_before, 1) if rss_before is not None and rss_after is not None else None,
+            'loaded_at': time.time(),
+            'error': error,
+        }
+        logger.info(f"NLP model '{name}' {'loaded' if model is not False else 'unavailable'} in {elapsed:.2f}s (pid {os.getpid()})")
+        return model
+    
+    def warmup(self, names: Optional[list] = None) -> None:
+        """Load the given models (all by default) now instead of on first use."""
+        for name in names or self._loaders:
+            self.get(name)
+    
+    def stats(self) -> dict:
+        rss = process_rss_mb()
+        return {
+            'pid': os.getpid(),
+            'rss_mb': round(rss, 1) if rss is not None else None,
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+            'classifier_backend': getattr(settings, 'GENRE_CLASSIFIER_BACKEND', PYTORCH_BACKEND),
+            'models': {
+                name: self._stats.get(name, {'loaded': False, 'load_seconds': None, 'rss_delta_mb': None})
+                for name in self._loaders
+            },
+        }
+
+
+model_registry = ModelRegistry({
+    SPACY_MODEL: load_spacy_model,
+    GENRE_CLASSIFIER: load_genre_classifier,
+})
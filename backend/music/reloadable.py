@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class Reloadable:
+    """
+    A process-wide object built on first use and kept current across worker
+    processes. At most every `interval_setting` seconds get() checks it:
+    with a version_key, the version shared through the cache is compared to
+    the one the object was built from and the object is rebuilt when another
+    process published a new one (see reload()); with a refresh callback,
+    refresh(obj) updates the object in place.
+    """
+    
+    def __init__(self, build: Callable[[], Any], interval_setting: str, version_key: Optional[str] = None,
+                 refresh: Optional[Callable[[Any], None]] = None, default_interval: int = 60):
+        self._build = build
+        self._refresh = refresh
+        self.interval_setting = interval_setting
+        self.version_key = version_key
+        self.default_interval = default_interval
+        
+        self._value = None
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self):
+        """The current object, built, rebuilt or refreshed as needed."""
+        now = time.monotonic()
+        interval = getattr(settings, self.interval_setting, self.default_interval)
+        if self._value is not None and now - self._checked_at < interval:
+            return self._value
+        
+        with self._lock:
+            if self._value is not None and now - self._checked_at < interval:
+                return self._value
+            
+            version = self._read_version()
+            if self._value is None or version != self._version:
+                self._value = self._build()
+                self._version = version
+            elif self._refresh is not None:
+                self._refresh(self._value)
+            self._checked_at = now
+            return self._value
+    
+    def reload(self) -> None:
+        """Rebuild this process's object and tell the other processes to rebuild theirs."""
+        version = time.time()
+        if self.version_key:
+            try:
+                cache.set(self.version_key, version, None)
+            except Exception as e:
+                logger.warning(f"Could not publish {self.version_key}: {e}")
+        
+        with self._lock:
+            self._value = self._build()
+            self._version = version
+            self._checked_at = time.monotonic()
+    
+    @property
+    def version(self):
+        """Version of the data the current object was built from."""
+        self.get()
+        return self._version
+    
+    def _read_version(self):
+        if not self.version_key:
+            return self._version
+        try:
+            return cache.get(self.version_key)
+        except Exception:
+            return self._version
+
+
+def read_table(query: Callable[[], Any], default: Any, fallback: str) -> Any:
+    """
+    Run a query that feeds a Reloadable object. The table may not exist yet
+    (e.g. before migrations), in which case default is returned and the
+    object is built from `fallback` only.
+    """
+    try:
+        return query()
+    except Exception as e:
+        logger.warning(f"Using {fallback} only: {e}")
+        return default
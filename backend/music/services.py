@@ -1,35 +1,108 @@
 import requests
 import re
 import logging
-from typing import List, Optional
-from django.db import transaction
-from .models import Artist, Genre, ArtistGenre
-import spacy
-from transformers import pipeline
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+from django.utils import timezone
+from .concurrency import host_limiter, run_concurrently
+from .gazetteer import get_gazetteer
+from .genre_aliases import canonicalize_genre
+from .genre_writer import write_artist_genres
+from .http_cache import WikipediaResponseCache
+from .models import Artist, GenreLookupMiss
+from .nlp_models import GENRE_CLASSIFIER, SPACY_MODEL, classify_texts, is_genre_classification, model_registry
+from .term_matcher import GENRE, REJECT, get_term_matcher
+from .verdicts import (
+    AFTER_GAZETTEER_STAGES, STAGE_GAZETTEER, STAGE_GENRE_NLP, STAGE_LENGTH, STAGE_NOT_SUSPICIOUS, STAGE_OBVIOUS,
+    STAGE_PATTERN, STAGE_PERSON_NLP, STAGE_RULE, GenreVerdictStore, normalize_verdict_key,
+)
+from .verdicts import verdict_store as shared_verdict_store
+from .wikitext import extract_infobox_genres, scan_lead_infobox, split_genre_value
 
 logger = logging.getLogger(__name__)
 
+# The MediaWiki query API accepts at most 50 titles per request
+MAX_TITLES_PER_QUERY = 50
+
+# Candidate pages fetched per artist in each batched round, and in total
+CANDIDATES_PER_ROUND = 3
+MAX_CANDIDATES_PER_ARTIST = 12
+
+# Base score of a search result by its priority tier in _search_artist
+CANDIDATE_PRIORITY_SCORES = {3: 100, 2: 60, 1: 30, 0: 20}
+
 class WikipediaGenreService:
-    def __init__(self):
+    def __init__(self, lead_section_only: Optional[bool] = None, max_workers: Optional[int] = None,
+                 response_cache: Optional[WikipediaResponseCache] = None,
+                 verdict_store: Optional[GenreVerdictStore] = None):
         self.base_url = 'https://en.wikipedia.org/w/api.php'
+        
+        # Searches and page batches run on a bounded thread pool
+        if max_workers is None:
+            max_workers = getattr(settings, 'ENRICHMENT_MAX_WORKERS', 8)
+        self.max_workers = max_workers
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Jammy/1.0 (https://your-domain.com; your-email@example.com)'
         })
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(max_workers, 1))
+        self.session.mount('https://', adapter)
+        
+        # Only download section 0 (where the infobox lives) unless told otherwise
+        if lead_section_only is None:
+            lead_section_only = getattr(settings, 'WIKIPEDIA_LEAD_SECTION_ONLY', True)
+        self.lead_section_only = lead_section_only
+        
+        # Search and page responses are cached across requests
+        if response_cache is None and getattr(settings, 'WIKIPEDIA_RESPONSE_CACHE', True):
+            response_cache = WikipediaResponseCache()
+        self.response_cache = response_cache
+        
+        # Genre validation verdicts are memoized in-process and in the database
+        if verdict_store is None and getattr(settings, 'GENRE_VERDICT_STORE', True):
+            verdict_store = shared_verdict_store
+        self.verdict_store = verdict_store
         
-        # Initialize NLP models (lazy loading)
-        self._nlp = None
-        self._classifier = None
+        # Wikitext bytes downloaded, per requested page title and per artist
+        self.bytes_by_title = {}
+        self.bytes_by_artist = {}
+        
+        # {'pageid', 'title', 'revid'} of fetched pages, and of the page each artist resolved to
+        self.page_info = {}
+        self.page_bindings = {}
+        
+        # Revision ids confirmed current upstream during this service's lifetime
+        self.current_revisions = {}
+        
+        # Titles whose last page fetch failed, and artists whose last lookup hit a
+        # search or page error (so an empty result for them is not a real miss)
+        self.failed_titles = set()
+        self.failed_lookups = set()
+        
+        # Suspicious genre strings are sent through NLP this many at a time
+        self.nlp_batch_size = getattr(settings, 'GENRE_NLP_BATCH_SIZE', 32)
     
     def fetch_and_store_artist_genres(self, artist_id: int) -> List[str]:
         """Fetch genres from Wikipedia and store them for an artist."""
         try:
             artist = Artist.objects.get(id=artist_id)
+            
+            # Artists bound to a page are re-checked without searching
+            refreshed, _ = self.refresh_bound_artists([artist])
+            if artist.id in refreshed:
+                return refreshed[artist.id]
+            
             genres = self.get_artist_genres(artist.name)
             
             if genres:
                 self._store_genres(artist, genres)
+                self._store_page_binding(artist, self.page_bindings.get(artist.name))
+                GenreLookupMiss.objects.clear([artist.spotify_id])
                 logger.info(f"Stored {len(genres)} genres for {artist.name}")
+            elif artist.name not in self.failed_lookups:
+                GenreLookupMiss.objects.record_misses({artist.spotify_id: artist.name})
             
             return genres
         except Artist.DoesNotExist:
@@ -39,73 +112,270 @@ class WikipediaGenreService:
             logger.error(f"Error processing artist {artist_id}: {str(e)}")
             return []
     
-    # Replace the get_artist_genres method with this enhanced version
+    def fetch_and_store_genres_for_artists(self, artists: List[Artist]) -> Dict[int, List[str]]:
+        """
+        Fetch genres for several artists with batched page lookups and store them.
+        Artists bound to a Wikipedia page are re-checked without searching;
+        artists still backing off from an empty lookup are skipped. Artists
+        whose lookup hit an error are not recorded as misses.
+        """
+        results = {artist.id: [] for artist in artists}
+        refreshed, to_search = self.refresh_bound_artists(artists)
+        results.update(refreshed)
+        
+        backing_off = GenreLookupMiss.objects.pending_retry([artist.spotify_id for artist in to_search])
+        to_fetch = [artist for artist in to_search if artist.spotify_id not in backing_off]
+        genres_by_name = self.get_genres_for_artists([artist.name for artist in to_fetch])
+        misses = {}
+        found = {}
+        
+        for artist in to_fetch:
+            genres = genres_by_name.get(artist.name, [])
+            if genres:
+                found[artist] = genres
+            elif artist.name not in self.failed_lookups:
+                misses[artist.spotify_id] = artist.name
+        
+        if found:
+            try:
+                self._store_genres_for_artists(found)
+                self._store_page_bindings({artist: self.page_bindings.get(artist.name) for artist in found})
+                results.update({artist.id: genres for artist, genres in found.items()})
+            except Exception:
+                found = {}
+        
+        GenreLookupMiss.objects.record_misses(misses)
+        GenreLookupMiss.objects.clear([artist.spotify_id for artist in found])
+        return results
+
+    def refresh_bound_artists(self, artists: List[Artist]) -> Tuple[Dict[int, List[str]], List[Artist]]:
+        """
+        Re-check artists whose Wikipedia page is already known, with no searches.
+        One batched revision-id query covers all bound artists; page content is
+        only fetched for pages that changed since the genres were stored.
+        Returns the genres of the artists handled, and the artists that still
+        need a search (unbound, page gone, or no genres left on the page).
+        """
+        bound = [artist for artist in artists if artist.wikipedia_page_id]
+        to_search = [artist for artist in artists if not artist.wikipedia_page_id]
+        if not bound:
+            return {}, to_search
+        
+        revisions = self._fetch_revisions_by_page_id([artist.wikipedia_page_id for artist in bound])
+        for revision in revisions.values():
+            self.current_revisions[revision['title']] = revision['revid']
+        results = {}
+        changed = []
+        
+        for artist in bound:
+            revision = revisions.get(artist.wikipedia_page_id)
+            stored_genres = artist.genre_names
+            if not revision:
+                logger.info(f"Wikipedia page {artist.wikipedia_page_id} for {artist.name} is gone")
+                to_search.append(artist)
+            elif revision['revid'] == artist.wikipedia_revid and stored_genres:
+                results[artist.id] = stored_genres
+            else:
+                changed.append((artist, revision))
+        
+        if changed:
+            page_genres = self.extract_genres_from_pages([revision['title'] for _, revision in changed])
+            updated = {}
+            bindings = {}
+            for artist, revision in changed:
+                genres = page_genres.get(revision['title'], [])
+                if not genres:
+                    to_search.append(artist)
+                    continue
+                updated[artist] = genres
+                bindings[artist] = self.page_info.get(revision['title'], revision)
+                results[artist.id] = genres
+            
+            if updated:
+                self._store_genres_for_artists(updated)
+                self._store_page_bindings(bindings)
+        
+        return results, to_search
 
     def get_artist_genres(self, artist_name: str) -> List[str]:
         """Get genres for an artist from Wikipedia with comprehensive fallback strategies."""
-        try:
-            # Clean the artist name first
-            clean_name = artist_name.strip()
-            
-            # Strategy 1: Direct search
-            search_results = self._search_artist(clean_name)
-            if search_results:
-                for result in search_results:
-                    genres = self._extract_genres_from_page(result['title'])
+        return self.get_genres_for_artists([artist_name]).get(artist_name, [])
+
+    def get_genres_for_artists(self, artist_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Get genres for many artists at once.
+        All search variations of every artist are sent together and their
+        results scored in one pass (see _plan_searches). The best candidates of
+        all artists are then fetched in batched page queries, a few per artist
+        per round, until each artist has genres or runs out of candidates.
+        Artists left without genres because a search or page fetch failed are
+        added to failed_lookups.
+        """
+        unique_names = list(dict.fromkeys(name for name in artist_names if name))
+        results = {name: [] for name in unique_names}
+        self.failed_lookups.difference_update(unique_names)
+        ranked = self._plan_searches(unique_names)
+        
+        offset = 0
+        pending = [name for name in unique_names if ranked[name]]
+        while pending and offset < MAX_CANDIDATES_PER_ARTIST:
+            candidates = {
+                name: ranked[name][offset:offset + CANDIDATES_PER_ROUND] for name in pending
+            }
+            
+            all_titles = [title for titles in candidates.values() for title, _ in titles]
+            bytes_before = {title: self.bytes_by_title.get(title, 0) for title in all_titles}
+            try:
+                page_genres = self.extract_genres_from_pages(all_titles)
+            except Exception as e:
+                logger.error(f"Error fetching candidate pages: {str(e)}")
+                self.failed_titles.update(all_titles)
+                page_genres = {}
+            
+            for name, titles in candidates.items():
+                self.bytes_by_artist[name] = self.bytes_by_artist.get(name, 0) + sum(
+                    self.bytes_by_title.get(title, 0) - bytes_before[title] for title, _ in titles
+                )
+                for title, label in titles:
+                    genres = page_genres.get(title)
                     if genres:
-                        logger.info(f"Found genres for {artist_name} via direct search: {genres}")
-                        return genres
-            
-            # Strategy 2: Search variations with different terms
-            search_variations = [
-                f"{clean_name} musician",
-                f"{clean_name} singer", 
-                f"{clean_name} band",
-                f"{clean_name} rapper",
-                f"{clean_name} artist"
-            ]
-            
-            for variation in search_variations:
-                search_results = self._search_artist(variation)
-                if search_results:
-                    for result in search_results:
-                        genres = self._extract_genres_from_page(result['title'])
-                        if genres:
-                            logger.info(f"Found genres for {artist_name} via variation '{variation}': {genres}")
-                            return genres
-            
-            # Strategy 3: Try removing common prefixes/suffixes
-            name_variations = [clean_name]
-            
-            # Remove "The " prefix
-            if clean_name.lower().startswith('the '):
-                name_variations.append(clean_name[4:])
-            
-            # Handle stage names with symbols
-            if any(char in clean_name for char in ['$', '&', '.', ',']):
-                # Remove special characters
-                clean_variation = re.sub(r'[^\w\s]', '', clean_name)
-                name_variations.append(clean_variation)
-            
-            for name_var in name_variations:
-                if name_var != clean_name:  # Don't repeat the original search
-                    search_results = self._search_artist(name_var)
-                    if search_results:
-                        for result in search_results:
-                            genres = self._extract_genres_from_page(result['title'])
-                            if genres:
-                                logger.info(f"Found genres for {artist_name} via name variation '{name_var}': {genres}")
-                                return genres
-            
-            logger.warning(f"No genres found for {artist_name} after all search strategies")
-            return []
-            
+                        logger.info(f"Found genres for {name} via {label}: {genres}")
+                        results[name] = genres
+                        if title in self.page_info:
+                            self.page_bindings[name] = self.page_info[title]
+                        break
+                else:
+                    if any(title in self.failed_titles for title, _ in titles):
+                        self.failed_lookups.add(name)
+            
+            offset += CANDIDATES_PER_ROUND
+            pending = [name for name in pending if not results[name] and len(ranked[name]) > offset]
+        
+        for name in unique_names:
+            if results[name]:
+                self.failed_lookups.discard(name)
+            elif name in self.failed_lookups:
+                logger.warning(f"No genres found for {name}, but some lookups failed")
+            else:
+                logger.warning(f"No genres found for {name} after all search strategies")
+            logger.info(f"Transferred {self.bytes_by_artist.get(name, 0)} bytes of wikitext for {name}")
+        
+        return results
+
+    def _plan_searches(self, artist_names: List[str]) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Run every search variation for every artist concurrently and rank the
+        candidate titles per artist as [(title, label), ...], best first.
+        Direct searches are queued first; once an artist's direct search yields
+        a confident match, its variation searches that haven't started yet are
+        cancelled. Artists with a failed search are added to failed_lookups.
+        """
+        plans = {name: self._search_plan(name.strip()) for name in artist_names}
+        searches = {name: {} for name in artist_names}
+        confident = set()
+        
+        # Queue every artist's direct search before any variation
+        order = sorted(
+            ((name, index) for name in artist_names for index in range(len(plans[name]))),
+            key=lambda item: item[1]
+        )
+        
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1)) as executor:
+            futures = {}
+            futures_by_artist = {name: [] for name in artist_names}
+            for name, index in order:
+                future = executor.submit(self._run_search, plans[name][index][1])
+                futures[future] = (name, index)
+                futures_by_artist[name].append(future)
+            
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                name, index = futures[future]
+                try:
+                    searches[name][index] = future.result()
+                except Exception as e:
+                    logger.error(f"Search error for {plans[name][index][1]}: {str(e)}")
+                    self.failed_lookups.add(name)
+                    continue
+                
+                if name not in confident and self._is_confident_match(index, searches[name][index]):
+                    confident.add(name)
+                    for other in futures_by_artist[name]:
+                        other.cancel()
+        
+        return {
+            name: self._rank_candidates(plans[name], searches[name]) for name in artist_names
+        }
+
+    def _is_confident_match(self, plan_index: int, search_results: List[dict]) -> bool:
+        """A direct search whose top hit is the artist's own music disambiguation page."""
+        # Priority 3 means the title is the artist's name plus a music qualifier;
+        # priority 2 matches any musician's disambiguated page
+        return plan_index == 0 and bool(search_results) and search_results[0].get('priority', 0) == 3
+
+    def _rank_candidates(self, plan: List[Tuple[str, str]], searches: Dict[int, List[dict]]) -> List[Tuple[str, str]]:
+        """
+        Score candidate titles across all of an artist's searches in one pass.
+        A title scores by its best (priority, position, query) and gains a bonus
+        for every other query that also returned it.
+        """
+        scores = {}
+        labels = {}
+        hits = {}
+        
+        for index, search_results in searches.items():
+            # The direct search counts more than the variations
+            weight = 1.0 if index == 0 else 0.8
+            for position, result in enumerate(search_results):
+                title = result['title']
+                score = weight * (CANDIDATE_PRIORITY_SCORES.get(result.get('priority', 0), 0) - 5 * position)
+                hits[title] = hits.get(title, 0) + 1
+                if score > scores.get(title, float('-inf')):
+                    scores[title] = score
+                    labels[title] = plan[index][0]
+        
+        ranked = sorted(scores, key=lambda title: scores[title] + 10 * (hits[title] - 1), reverse=True)
+        return [(title, labels[title]) for title in ranked]
+
+    def _search_plan(self, clean_name: str) -> List[Tuple[str, str]]:
+        """Ordered (label, query) search steps tried for an artist."""
+        # Strategy 1: Direct search
+        plan = [('direct search', clean_name)]
+        
+        # Strategy 2: Search variations with different terms
+        for term in ['musician', 'singer', 'band', 'rapper', 'artist']:
+            variation = f"{clean_name} {term}"
+            plan.append((f"variation '{variation}'", variation))
+        
+        # Strategy 3: Try removing common prefixes/suffixes
+        name_variations = []
+        
+        # Remove "The " prefix
+        if clean_name.lower().startswith('the '):
+            name_variations.append(clean_name[4:])
+        
+        # Handle stage names with symbols
+        if any(char in clean_name for char in ['$', '&', '.', ',']):
+            # Remove special characters
+            name_variations.append(re.sub(r'[^\w\s]', '', clean_name))
+        
+        for name_var in name_variations:
+            if name_var != clean_name:  # Don't repeat the original search
+                plan.append((f"name variation '{name_var}'", name_var))
+        
+        return plan
+
+    def _search_artist(self, artist_name: str) -> List[dict]:
+        """Search for artist on Wikipedia with improved filtering; [] on errors."""
+        try:
+            return self._run_search(artist_name)
         except Exception as e:
-            logger.error(f"Error fetching genres for {artist_name}: {str(e)}")
+            logger.error(f"Search error for {artist_name}: {str(e)}")
             return []
 
-    def _search_artist(self, artist_name: str) -> List[dict]:
-        """Search for artist on Wikipedia with improved filtering."""
+    def _run_search(self, artist_name: str) -> List[dict]:
+        """Search for artist on Wikipedia with improved filtering; raises on request errors."""
         params = {
             'action': 'opensearch',
             'format': 'json',
@@ -113,159 +383,341 @@ class WikipediaGenreService:
             'limit': 10  # Increased from 5 to get more results
         }
         
-        try:
-            response = self.session.get(self.base_url, params=params, timeout=10)
+        data = self.response_cache.get_search(artist_name) if self.response_cache else None
+        if data is None:
+            response = self._get(params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
-            titles, descriptions, urls = data[1], data[2], data[3]
-            
-            results = []
-            prioritized_results = []
-            
-            for i, title in enumerate(titles):
-                desc = descriptions[i].lower() if i < len(descriptions) and descriptions[i] else ""
-                title_lower = title.lower()
-                original_name = artist_name.lower().replace(' musician', '').replace(' singer', '').replace(' band', '').replace(' rapper', '').replace(' artist', '')
-                
-                result = {
-                    'title': title,
-                    'description': descriptions[i] if i < len(descriptions) else "",
-                    'url': urls[i] if i < len(urls) else ""
-                }
-                
-                # Higher priority for exact matches with disambiguation
-                if (f'{original_name} (' in title_lower and 
-                    any(term in title_lower for term in ['musician', 'singer', 'rapper', 'band', 'artist'])):
-                    prioritized_results.insert(0, result)  # Insert at beginning for highest priority
-                
-                # High priority for other music disambiguations
-                elif any(term in title_lower for term in ['(musician)', '(singer)', '(rapper)', '(band)']):
-                    prioritized_results.append(result)
-                
-                # Medium priority for music-related descriptions or titles
-                elif (any(keyword in desc for keyword in ['singer', 'musician', 'band', 'artist', 'rapper']) or
-                      any(keyword in title_lower for keyword in ['musician', 'singer', 'band', 'rapper'])):
-                    results.append(result)
-                
-                # Low priority for exact title matches (might be the main page)
-                elif title_lower == original_name:
-                    results.append(result)
-            
-            # Return prioritized results first
-            final_results = prioritized_results + results
-            
-            logger.info(f"Search for '{artist_name}' found {len(final_results)} filtered results")
-            return final_results[:5]  # Limit to top 5 results
-            
-        except Exception as e:
-            logger.error(f"Search error for {artist_name}: {str(e)}")
-            return []
+            if self.response_cache:
+                self.response_cache.set_search(artist_name, data)
+        
+        titles, descriptions, urls = data[1], data[2], data[3]
+        
+        results = []
+        prioritized_results = []
+        
+        for i, title in enumerate(titles):
+            desc = descriptions[i].lower() if i < len(descriptions) and descriptions[i] else ""
+            title_lower = title.lower()
+            original_name = artist_name.lower().replace(' musician', '').replace(' singer', '').replace(' band', '').replace(' rapper', '').replace(' artist', '')
+            
+            result = {
+                'title': title,
+                'description': descriptions[i] if i < len(descriptions) else "",
+                'url': urls[i] if i < len(urls) else ""
+            }
+            
+            # Higher priority for exact matches with disambiguation
+            if (f'{original_name} (' in title_lower and 
+                any(term in title_lower for term in ['musician', 'singer', 'rapper', 'band', 'artist'])):
+                result['priority'] = 3
+                prioritized_results.insert(0, result)  # Insert at beginning for highest priority
+            
+            # High priority for other music disambiguations
+            elif any(term in title_lower for term in ['(musician)', '(singer)', '(rapper)', '(band)']):
+                result['priority'] = 2
+                prioritized_results.append(result)
+            
+            # Medium priority for music-related descriptions or titles
+            elif (any(keyword in desc for keyword in ['singer', 'musician', 'band', 'artist', 'rapper']) or
+                  any(keyword in title_lower for keyword in ['musician', 'singer', 'band', 'rapper'])):
+                result['priority'] = 1
+                results.append(result)
+            
+            # Low priority for exact title matches (might be the main page)
+            elif title_lower == original_name:
+                result['priority'] = 0
+                results.append(result)
+        
+        # Return prioritized results first
+        final_results = prioritized_results + results
+        
+        logger.info(f"Search for '{artist_name}' found {len(final_results)} filtered results")
+        return final_results[:5]  # Limit to top 5 results
     
-    # Replace the _extract_genres_from_page method with this corrected version
-
     def _extract_genres_from_page(self, page_title: str) -> List[str]:
         """Extract genres from a Wikipedia page, following redirects if necessary."""
-        params = {
+        return self.extract_genres_from_pages([page_title]).get(page_title, [])
+
+    def extract_genres_from_pages(self, page_titles: List[str]) -> Dict[str, List[str]]:
+        """
+        Extract genres from many Wikipedia pages in as few requests as possible.
+        Returns a map of each requested title to its genres (empty when the page
+        is missing or has no genre field).
+        """
+        contents = self._fetch_page_contents(page_titles)
+        results = {}
+        genre_items = {}
+        
+        for title in dict.fromkeys(page_titles):
+            results[title] = []
+            content = contents.get(title)
+            if not content:
+                continue
+            
+            try:
+                genre_items[title] = self._parse_genre_items(title, content)
+            except Exception as e:
+                logger.error(f"Error extracting genres from page {title}: {str(e)}")
+        
+        # Validate the candidates from every page together, so the suspicious
+        # ones go through NLP in batches
+        verdicts = self._validate_genres([item for items in genre_items.values() for item in items])
+        for title, items in genre_items.items():
+            results[title] = self._clean_genre_items(items, verdicts)
+        
+        return results
+
+    def _fetch_page_contents(self, page_titles: List[str], follow_redirects: bool = True) -> Dict[str, str]:
+        """
+        Fetch the latest wikitext for many titles, MAX_TITLES_PER_QUERY per request.
+        API normalizations and redirects are resolved in bulk and mapped back to
+        the requested titles; leftover '#REDIRECT' pages are followed with one
+        more batch. In lead-section mode only section 0 is downloaded, and the
+        full page is fetched only for pages whose infobox is cut off.
+        """
+        unique_titles = list(dict.fromkeys(title for title in page_titles if title))
+        section = 0 if self.lead_section_only else None
+        contents = self._fetch_in_batches(unique_titles, section)
+        
+        if section is not None:
+            truncated = [title for title, content in contents.items() if scan_lead_infobox(content)[1]]
+            if truncated:
+                logger.info(f"Infobox cut off in lead section, fetching full pages: {truncated}")
+                contents.update(self._fetch_in_batches(truncated, None))
+        
+        if follow_redirects:
+            manual_redirects = {}
+            for title, content in contents.items():
+                if content.strip().upper().startswith('#REDIRECT'):
+                    redirect_match = re.search(r'#REDIRECT\s*\[\[([^\]]+)\]\]', content, re.IGNORECASE)
+                    if redirect_match:
+                        redirect_target = redirect_match.group(1).split('#')[0].strip()
+                        logger.info(f"Manual redirect detected: {title} -> {redirect_target}")
+                        manual_redirects[title] = redirect_target
+            
+            if manual_redirects:
+                targets = self._fetch_page_contents(list(manual_redirects.values()), follow_redirects=False)
+                for title, target in manual_redirects.items():
+                    contents[title] = targets.get(target, '')
+                    if target in self.failed_titles:
+                        self.failed_titles.add(title)
+                    if target in self.page_info:
+                        self.page_info[title] = self.page_info[target]
+                    self.bytes_by_title[title] = (
+                        self.bytes_by_title.get(title, 0) + self.bytes_by_title.get(target, 0)
+                    )
+        
+        return contents
+
+    def _fetch_in_batches(self, titles: List[str], section: Optional[int]) -> Dict[str, str]:
+        """
+        Fetch wikitext for any number of titles, MAX_TITLES_PER_QUERY at a time.
+        Cached pages are served from the response cache; cached pages that are
+        due for revalidation only have their revision id checked, and are
+        downloaded again only when the page changed upstream. Titles in
+        batches that fail are added to failed_titles.
+        """
+        cached = self.response_cache.get_pages(titles, section) if self.response_cache else {}
+        
+        # Drop cached pages already known to be outdated
+        for title, entry in list(cached.items()):
+            current = self.current_revisions.get(title)
+            if current is not None and current != entry['revid']:
+                del cached[title]
+        
+        stale = [
+            title for title, entry in cached.items()
+            if entry['stale'] and title not in self.current_revisions
+        ]
+        if stale:
+            current = self._fetch_revision_ids(stale)
+            unchanged = {}
+            for title in stale:
+                if title in current and current[title]['revid'] == cached[title]['revid']:
+                    unchanged[title] = current[title]
+                else:
+                    del cached[title]
+            self.response_cache.mark_checked(unchanged, section)
+        
+        to_fetch = [title for title in titles if title not in cached]
+        fetched = {}
+        for batch_pages in self._run_batches(self._fetch_page_batch, to_fetch, section):
+            fetched.update(batch_pages)
+        
+        if self.response_cache and fetched:
+            self.response_cache.set_pages(fetched, section)
+        self.failed_titles.difference_update(list(cached) + list(fetched))
+        
+        contents = {}
+        for title, page in list(cached.items()) + list(fetched.items()):
+            contents[title] = page['content']
+            self.page_info[title] = {key: page.get(key) for key in ('pageid', 'title', 'revid')}
+        return contents
+
+    def _fetch_revision_ids(self, titles: List[str]) -> Dict[str, dict]:
+        """Latest {'pageid', 'title', 'revid'} for each title, without downloading any content."""
+        revids = {}
+        for batch_revids in self._run_batches(self._fetch_revision_batch, titles):
+            revids.update(batch_revids)
+        return revids
+
+    def _run_batches(self, fetch_batch, titles: List[str], *args) -> List[dict]:
+        """Run fetch_batch over MAX_TITLES_PER_QUERY-sized chunks of titles concurrently."""
+        batches = [titles[i:i + MAX_TITLES_PER_QUERY] for i in range(0, len(titles), MAX_TITLES_PER_QUERY)]
+        
+        def fetch(batch):
+            try:
+                return fetch_batch(batch, *args)
+            except Exception as e:
+                logger.error(f"Error fetching pages {batch}: {str(e)}")
+                self.failed_titles.update(batch)
+                return {}
+        
+        return run_concurrently(fetch, batches, self.max_workers)
+
+    def _get(self, params: dict, timeout: int = 10) -> requests.Response:
+        """GET the MediaWiki API while holding a per-host concurrency slot."""
+        with host_limiter.limit(self.base_url):
+            return self.session.get(self.base_url, params=params, timeout=timeout)
+
+    def _query_pages(self, titles: List[str], params: dict, timeout: int = 15) -> Dict[str, dict]:
+        """
+        Run a prop=revisions query for up to MAX_TITLES_PER_QUERY titles and
+        return the resulting page objects keyed by requested title.
+        """
+        params = dict(params, **{
             'action': 'query',
             'format': 'json',
             'prop': 'revisions',
-            'rvprop': 'content',
-            'rvslots': 'main',
-            'rvlimit': 1,
             'redirects': True,  # This will follow redirects automatically
-            'titles': page_title
-        }
+            'titles': '|'.join(titles)
+        })
         
-        try:
-            response = self.session.get(self.base_url, params=params, timeout=10)
+        aliases = {}
+        pages = {}
+        
+        while True:
+            response = self._get(params, timeout=timeout)
             response.raise_for_status()
-            
             data = response.json()
+            query = data.get('query', {})
             
-            # Check if there were redirects
-            if 'redirects' in data['query']:
-                redirects = data['query']['redirects']
-                final_title = redirects[-1]['to']  # Get the final redirect target
-                logger.info(f"Following redirect: {page_title} -> {final_title}")
-        
-            pages = data['query']['pages']
-            page = list(pages.values())[0]
-            
-            if 'revisions' not in page:
-                return []
-            
-            content = page['revisions'][0]['slots']['main']['*']
-            
-            # Check if this is still a redirect (backup check)
-            if content.strip().startswith('#REDIRECT'):
-                redirect_match = re.search(r'#REDIRECT\s*\[\[([^\]]+)\]\]', content, re.IGNORECASE)
-                if redirect_match:
-                    redirect_target = redirect_match.group(1)
-                    logger.info(f"Manual redirect detected: {page_title} -> {redirect_target}")
-                    # Recursively follow the redirect
-                    return self._extract_genres_from_page(redirect_target)
-        
-            # If we suspect the content is truncated (no closing }}), try getting more
-            if '{{hlist' in content or '{{flatlist' in content:
-                # Look for infobox
-                infobox_match = re.search(r'\{\{Infobox[^}]*?\|\s*genre\s*=.*?\}\}', content, re.DOTALL | re.IGNORECASE)
-                if not infobox_match:
-                    # Content might be truncated, try getting full page content
-                    params['rvsection'] = None  # Get full content
-                    response = self.session.get(self.base_url, params=params, timeout=15)
-                    response.raise_for_status()
-                    data = response.json()
-                    pages = data['query']['pages']
-                    page = list(pages.values())[0]
-                    if 'revisions' in page:
-                        content = page['revisions'][0]['slots']['main']['*']
-
-            # Find the genre field in the infobox
-            genre_pattern = r'\|\s*genre\s*=\s*(.*?)(?=\n\s*\|[a-zA-Z_]|\n\}\}|\Z)'
-            match = re.search(genre_pattern, content, re.IGNORECASE | re.DOTALL)
+            # Normalizations and redirects both map a 'from' title to a 'to' title
+            for entry in query.get('normalized', []) + query.get('redirects', []):
+                aliases[entry['from']] = entry['to']
             
-            if match:
-                genre_content = match.group(1).strip()
-                return self._clean_genre_text(genre_content)
+            for page in query.get('pages', {}).values():
+                if 'revisions' in page:
+                    pages[page['title']] = page
             
-            logger.info(f"No genre field found for {page_title}")
+            # Large responses are split; ask for the remaining revisions
+            if 'continue' not in data:
+                break
+            params.update(data['continue'])
         
-        except Exception as e:
-            logger.error(f"Error extracting genres from page {page_title}: {str(e)}")
+        results = {}
+        for title in titles:
+            final_title = title
+            seen = {final_title}
+            while final_title in aliases and aliases[final_title] not in seen:
+                final_title = aliases[final_title]
+                seen.add(final_title)
+            
+            if final_title != title:
+                logger.info(f"Following redirect: {title} -> {final_title}")
+            
+            if final_title in pages:
+                results[title] = pages[final_title]
+        
+        return results
+
+    def _fetch_page_batch(self, titles: List[str], section: Optional[int] = None) -> Dict[str, dict]:
+        """
+        Fetch {'pageid', 'title', 'revid', 'content'} for up to MAX_TITLES_PER_QUERY
+        titles, keyed by requested title.
+        """
+        params = {
+            'rvprop': 'ids|content',
+            'rvslots': 'main',
+        }
+        if section is not None:
+            params['rvsection'] = section
+        
+        pages = {}
+        for title, page in self._query_pages(titles, params).items():
+            revision = page['revisions'][0]
+            content = revision['slots']['main']['*']
+            pages[title] = {
+                'pageid': page.get('pageid'),
+                'title': page['title'],
+                'revid': revision.get('revid'),
+                'content': content,
+            }
+            self.bytes_by_title[title] = self.bytes_by_title.get(title, 0) + len(content.encode('utf-8'))
+        
+        return pages
+
+    def _fetch_revision_batch(self, titles: List[str]) -> Dict[str, dict]:
+        """Fetch only the latest revision id for up to MAX_TITLES_PER_QUERY titles."""
+        pages = self._query_pages(titles, {'rvprop': 'ids'}, timeout=10)
+        return {
+            title: {'pageid': page.get('pageid'), 'title': page['title'], 'revid': page['revisions'][0]['revid']}
+            for title, page in pages.items()
+        }
+
+    def _fetch_revisions_by_page_id(self, page_ids: List[int]) -> Dict[int, dict]:
+        """Latest {'pageid', 'title', 'revid'} for known page ids, MAX_TITLES_PER_QUERY per request."""
+        
+        def fetch(batch):
+            params = {
+                'action': 'query',
+                'format': 'json',
+                'prop': 'revisions',
+                'rvprop': 'ids',
+                'pageids': '|'.join(str(page_id) for page_id in batch)
+            }
+            response = self._get(params, timeout=10)
+            response.raise_for_status()
+            pages = response.json().get('query', {}).get('pages', {})
+            return {
+                page['pageid']: {'pageid': page['pageid'], 'title': page['title'], 'revid': page['revisions'][0]['revid']}
+                for page in pages.values() if 'revisions' in page
+            }
+        
+        revisions = {}
+        for batch_revisions in self._run_batches(fetch, page_ids):
+            revisions.update(batch_revisions)
+        return revisions
+
+    def _parse_genre_items(self, page_title: str, content: str) -> List[str]:
+        """Raw, unvalidated genre strings from the lead infobox wikitext."""
+        genre_items = extract_infobox_genres(content)
+        
+        if genre_items is None:
+            logger.info(f"No genre field found for {page_title}")
             return []
+        
+        return genre_items
 
     def _clean_genre_text(self, text: str) -> List[str]:
+        """Clean and extract genres from a raw infobox genre value."""
+        return self._clean_genre_items(split_genre_value(text))
+
+    def _clean_genre_items(self, genre_items: List[str], verdicts: Optional[Dict[str, bool]] = None) -> List[str]:
         """
-        Clean and extract genres from Wikipedia content.
-        1. Strip all HTML tags and entities.
-        2. Extract [[...]] links first, then fallback to splitting.
-        3. Filter out non-genre entries (discographies, labels, etc.).
-        4. Deduplicate while preserving order.
+        Validate, normalize and deduplicate genre strings from the parser.
+        1. Filter out non-genre entries (discographies, labels, etc.).
+        2. Deduplicate while preserving order.
+        verdicts may hold results of an earlier _validate_genres call covering genre_items.
         """
-        # 1) Remove HTML tags & entities
-        text = re.sub(r'<[^>]+>', '', text)    # strip <ref>…</ref> or any HTML tag
-        text = re.sub(r'&[a-z]+;', '', text)   # strip &nbsp;, &amp;, etc.
-
-        genre_parts: List[str] = []
-
-        # 2) Find all [[…]] links first (ignore anything after '|' or '#')
-        raw_links = re.findall(r'\[\[([^|\]\#]+)', text)
-
-        if raw_links:
-            for link in raw_links:
-                part = link.strip()
-                if self._is_valid_genre(part):
-                    genre_parts.append(part)
-        else:
-            # 3) Fallback: split on comma, semicolon, pipe, slash
-            simple_parts = re.split(r'[;,|/]', text)
-            for part in simple_parts:
-                part = part.strip()
-                if part and self._is_valid_genre(part):
-                    genre_parts.append(part)
-
-        # 4) Filter out obvious non-genres and deduplicate
+        # 1) Keep only strings that look like genres
+        if verdicts is None:
+            verdicts = self._validate_genres(genre_items)
+        genre_parts = [part for part in genre_items if verdicts[part]]
+
+        # 2) Filter out obvious non-genres and deduplicate
         filtered_genres = []
         seen = set()
 
@@ -283,45 +735,78 @@ class WikipediaGenreService:
 
     def _is_valid_genre(self, text: str) -> bool:
         """Enhanced genre validation with NLP support"""
+        return self._validate_genres([text]).get(text, False)
+
+    def _validate_genres(self, texts: List[str]) -> Dict[str, bool]:
+        """
+        Validate several genre strings, consulting the verdict store first so
+        each distinct string is judged (and sent through NLP) only once.
+        Rejections from stages after the gazetteer are judged again once the
+        string is a known genre.
+        """
+        verdicts = self.verdict_store.get_many(texts) if self.verdict_store else {}
+        gazetteer = get_gazetteer()
+        
+        pending = {}
+        for text in texts:
+            key = normalize_verdict_key(text)
+            verdict = verdicts.get(key)
+            # A string rejected after the gazetteer stage may have become a known genre since; judge it again
+            if (verdict and not verdict['accepted'] and verdict['stage'] in AFTER_GAZETTEER_STAGES
+                    and gazetteer.lookup(text)):
+                verdict = None
+            if verdict is not None:
+                logger.debug(f"Memoized verdict for '{text}': {'accepted' if verdict['accepted'] else 'rejected'} at {verdict['stage']}")
+            elif key not in pending:
+                pending[key] = text
+        
+        if pending:
+            judged = self._judge_genres(list(pending.values()))
+            new_verdicts = {key: judged[text] for key, text in pending.items()}
+            verdicts.update(new_verdicts)
+            if self.verdict_store:
+                self.verdict_store.put_many(new_verdicts)
+        
+        return {text: verdicts[normalize_verdict_key(text)]['accepted'] for text in texts}
+
+    def _judge_genres(self, texts: List[str]) -> Dict[str, dict]:
+        """
+        Run the validation stages for many strings; returns {text: {'accepted', 'stage', 'scores'}}.
+        Rules decide most strings; the suspicious rest share one batched NLP pass.
+        """
+        verdicts = {}
+        suspicious = []
+        for text in texts:
+            verdict = self._judge_genre_by_rules(text)
+            if verdict is None:
+                suspicious.append(text)
+            else:
+                verdicts[text] = verdict
+        
+        if suspicious:
+            verdicts.update(self._judge_genres_nlp(suspicious))
+        return verdicts
+
+    def _judge_genre_by_rules(self, text: str) -> Optional[dict]:
+        """Rule-based verdict for one string, or None when it is suspicious and needs NLP."""
         if not text or len(text) < 2 or len(text) > 40:
-            return False
+            return {'accepted': False, 'stage': STAGE_LENGTH, 'scores': {}}
         
         text_lower = text.lower()
         
-        # First pass: Rule-based filtering for obvious non-genres
-        invalid_terms = [
-            'discography', 'records', 'entertainment', 'music group',
-            'band', 'artist', 'label', 'inc.', 'ltd.', 'corporation',
-            'cite', 'ref', 'url', 'website', 'magazine', 'wikipedia',
-            'category:', 'file:', 'image:', 'template:', 'user:',
-            'list of', 'timeline of', 'history of',
-            'sub pop', 'truth and soul', 'def jam', 'columbia',
-            'atlantic', 'warner', 'universal', 'sony', 'emi',
-            'interscope', 'capitol', 'republic', 'rca', 'parlophone',
-            'flying tart', 'prometheus global media',
-            'group)', '(group)', 'collective', 'crew', 'posse',
-            'underground', 'thug life', 'outlawz', 'digital underground',
-            'death row', 'bad boy', 'roc-a-fella',
-            # Media outlets and websites
-            'allmusic', 'pitchfork', 'rolling stone', 'nme', 'spin',
-            'ones to watch', 'i-d', 'uproxx', 'billboard', 'complex',
-            'hypebeast', 'fader', 'stereogum', 'consequence of sound',
-            # TV/Radio personalities
-            'tablo', 'jeong hyeong-don', 'jimmy fallon', 'conan',
-            # Artist collaborations/side projects
-            'stephen malkmus and the jicks', 'hope sandoval & the warm inventions',
-            'hope sandoval and the warm inventions',
-        ]
-        
-        # Add known artist names that commonly appear
-        known_artists = [
-            'morrissey', 'johnny marr', 'andy rourke', 'mike joyce',
-            'thom yorke', 'radiohead', 'kurt cobain', 'dave grohl'
-        ]
+        # First pass: Rule-based filtering for obvious non-genres. One scan
+        # over the text finds both blocklisted and obvious-genre terms.
+        matched = get_term_matcher().classify(text_lower)
         
-        if any(term in text_lower for term in invalid_terms + known_artists):
+        if REJECT in matched:
             print(f"RULE-BASED: '{text}' rejected - contains invalid term or known artist")
-            return False
+            return {'accepted': False, 'stage': STAGE_RULE, 'scores': {}}
+        
+        # Known genres and their aliases are accepted without further checks
+        known = get_gazetteer().lookup(text)
+        if known:
+            logger.debug(f"Gazetteer accepted '{text}' as known genre '{known}'")
+            return {'accepted': True, 'stage': STAGE_GAZETTEER, 'scores': {'genre': known}}
         
         # Additional pattern checks for artist collaborations
         if (text_lower.endswith('discography') or 
@@ -335,19 +820,12 @@ class WikipediaGenreService:
             # Check for single word entries that might be names/brands
             (len(text.split()) == 1 and text.istitle() and len(text) > 8)):
             print(f"RULE-BASED: '{text}' rejected - failed pattern checks")
-            return False
+            return {'accepted': False, 'stage': STAGE_PATTERN, 'scores': {}}
         
         # Quick check for obvious genres (skip NLP for performance)
-        obvious_genres = [
-            'rock', 'pop', 'jazz', 'hip hop', 'rap', 'metal', 'folk', 'country',
-            'electronic', 'dance', 'reggae', 'blues', 'punk', 'alternative',
-            'indie', 'soul', 'funk', 'r&b', 'classical', 'gospel', 'house',
-            'techno', 'trance', 'dubstep', 'ambient', 'experimental'
-        ]
-        
-        if any(genre_word in text_lower for genre_word in obvious_genres):
+        if GENRE in matched:
             print(f"OBVIOUS GENRE: '{text}' - accepted without NLP")
-            return True
+            return {'accepted': True, 'stage': STAGE_OBVIOUS, 'scores': {}}
         
         # Second pass: NLP validation for suspicious cases
         suspicious_patterns = [
@@ -361,213 +839,146 @@ class WikipediaGenreService:
         
         if any(suspicious_patterns):
             print(f"SUSPICIOUS: '{text}' - triggering NLP validation")
-            
-            # Use NLP to make final decision
-            if self._is_person_name_nlp(text):
+            return None
+        
+        print(f"NOT SUSPICIOUS: '{text}' - passed without NLP check")
+        return {'accepted': True, 'stage': STAGE_NOT_SUSPICIOUS, 'scores': {}}
+
+    def _judge_genres_nlp(self, texts: List[str]) -> Dict[str, dict]:
+        """Use NLP to make the final decision for suspicious strings, in batches."""
+        verdicts = {}
+        scores = {text: {} for text in texts}
+        
+        persons = self._detect_person_names_nlp(texts, scores)
+        candidates = []
+        for text in texts:
+            if persons[text]:
                 print(f"NLP: '{text}' identified as person name - REJECTED")
-                return False
-            
-            if not self._is_likely_genre_nlp(text):
-                print(f"NLP: '{text}' not identified as music genre - REJECTED")
-                return False
+                verdicts[text] = {'accepted': False, 'stage': STAGE_PERSON_NLP, 'scores': scores[text]}
             else:
+                candidates.append(text)
+        
+        genres = self._classify_genres_nlp(candidates, scores)
+        for text in candidates:
+            if genres[text]:
                 print(f"NLP: '{text}' identified as music genre - ACCEPTED")
-        else:
-            print(f"NOT SUSPICIOUS: '{text}' - passed without NLP check")
-    
-        return True
+            else:
+                print(f"NLP: '{text}' not identified as music genre - REJECTED")
+            verdicts[text] = {'accepted': genres[text], 'stage': STAGE_GENRE_NLP, 'scores': scores[text]}
+        
+        return verdicts
 
     def _normalize_genre(self, genre: str) -> str:
-        """Normalize genre string to a standard format."""
-        if not genre:
-            return ""
-        
-        genre = genre.strip()
-        genre = re.sub(r'[<>{}]', '', genre)
-        
-        # Comprehensive genre mappings
-        genre_mappings = {
-            # Capitalization fixes
-            'west coast hip-hop': 'West Coast hip hop',
-            'gangsta rap': 'gangster rap',
-            'political hip-hop': 'conscious hip hop',
-            
-            # R&B variations
-            'alternative r&b': 'alternative R&B',
-            'r&b': 'R&B',
-            'contemporary r&b': 'contemporary R&B',
-            'rhythm and blues': 'R&B',
-            
-            # Hip hop variations
-            'hip hop music': 'hip hop',
-            'hip-hop': 'hip hop',
-            'hiphop': 'hip hop',
-            
-            # Pop variations
-            'pop music': 'pop',
-            'popular music': 'pop',
-            
-            # Rock variations
-            'rock music': 'rock',
-            'rock and roll': 'rock',
-            'rock & roll': 'rock',
-            
-            # Electronic variations
-            'electronic music': 'electronic',
-            'electronica': 'electronic',
-            
-            # Jazz variations
-            'jazz music': 'jazz',
-            
-            # Folk variations
-            'folk music': 'folk',
-            'folk rock': 'folk rock',
-            'folk-rock': 'folk rock',
-            
-            # Soul variations
-            'soul music': 'soul',
-            'neo soul': 'neo-soul',
-            'neo-soul': 'neo-soul',
-            
-            # Other normalizations
-            'alternative hip-hop': 'alternative hip hop',
-            'southern hip-hop': 'Southern hip hop',
-        }
-        
-        # Get normalized version or use original
-        normalized = genre_mappings.get(genre.lower(), genre)
-        
-        # Special case for R&B - keep capitalized
-        if 'r&b' in normalized.lower():
-            return normalized.replace('r&b', 'R&B').replace('R&b', 'R&B')
-        
-        # Special case for K-pop/K-rock - capitalize K
-        if normalized.lower().startswith('k-'):
-            return 'K-' + normalized[2:]
-        
-        # Title case for multi-word genres, lowercase for single words
-        if ' ' in normalized:
-            return normalized.title()
-        else:
-            return normalized.lower()
+        """Normalize genre string to its canonical name (one alias-index lookup)."""
+        return canonicalize_genre(genre)
         
     def _store_genres(self, artist: Artist, genres: List[str]) -> None:
         """Store genres for an artist in the database."""
+        self._store_genres_for_artists({artist: genres})
+
+    def _store_genres_for_artists(self, genres_by_artist: Dict[Artist, List[str]]) -> None:
+        """Store the genres of many artists with one bulk write."""
         try:
-            with transaction.atomic():
-                # Remove existing genre relationships for this artist
-                ArtistGenre.objects.filter(artist=artist).delete()
-                
-                # Create or get genres and link them to the artist
-                for genre_name in genres:
-                    # Normalize the genre name
-                    normalized_name = self._normalize_genre(genre_name)
-                    
-                    # Create or get the genre
-                    genre, created = Genre.objects.get_or_create(
-                        name=normalized_name,
-                        defaults={'name': normalized_name}
-                    )
-                    
-                    # Create the artist-genre relationship
-                    ArtistGenre.objects.get_or_create(
-                        artist=artist,
-                        genre=genre
-                    )
-                
-                logger.info(f"Successfully stored {len(genres)} genres for {artist.name}")
-                
+            write_artist_genres(genres_by_artist)
         except Exception as e:
-            logger.error(f"Error storing genres for {artist.name}: {str(e)}")
+            logger.error(f"Error storing genres for {len(genres_by_artist)} artists: {str(e)}")
             raise
 
+    def _store_page_binding(self, artist: Artist, binding: Optional[dict]) -> None:
+        """Remember which Wikipedia page (and revision) an artist's genres came from."""
+        self._store_page_bindings({artist: binding})
+
+    def _store_page_bindings(self, bindings: Dict[Artist, Optional[dict]]) -> None:
+        """Remember the Wikipedia pages of many artists with one bulk update."""
+        now = timezone.now()
+        updated = []
+        for artist, binding in bindings.items():
+            if not binding or not binding.get('pageid'):
+                continue
+            artist.wikipedia_page_id = binding['pageid']
+            artist.wikipedia_title = binding.get('title') or ''
+            artist.wikipedia_revid = binding.get('revid')
+            artist.updated_at = now
+            updated.append(artist)
+        
+        if updated:
+            Artist.objects.bulk_update(updated, ['wikipedia_page_id', 'wikipedia_title', 'wikipedia_revid', 'updated_at'])
+
     def _get_nlp(self):
-        """Lazy load spaCy model"""
-        if self._nlp is None:
-            try:
-                self._nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                # Fallback if model not installed
-                self._nlp = False
-        return self._nlp
+        """spaCy model from the process-wide registry (False when unavailable)"""
+        return model_registry.get(SPACY_MODEL)
 
     def _get_classifier(self):
-        """Lazy load classification model"""
-        if self._classifier is None:
-            try:
-                # Use a lightweight model for better performance
-                self._classifier = pipeline(
-                    "zero-shot-classification",
-                    model="typeform/distilbert-base-uncased-mnli"
-                )
-            except Exception:
-                self._classifier = False
-        return self._classifier
+        """Zero-shot classifier from the process-wide registry (False when unavailable)"""
+        return model_registry.get(GENRE_CLASSIFIER)
 
-    def _is_likely_genre_nlp(self, text: str) -> bool:
-        """Use NLP to determine if text is likely a music genre"""
+    def _classify_genres_nlp(self, texts: List[str], scores: Dict[str, dict]) -> Dict[str, bool]:
+        """
+        Use the zero-shot classifier to decide which texts are likely music
+        genres, feeding it all texts in batches. Label scores go into scores[text].
+        """
+        if not texts:
+            return {}
+        
         classifier = self._get_classifier()
         if not classifier:
-            return True  # Fallback to allowing it
+            for text in texts:
+                scores[text]['fallback'] = True
+            return {text: True for text in texts}  # Fallback to allowing it
         
         try:
-            candidate_labels = [
-                "music genre",
-                "person name", 
-                "company name",
-                "website name",
-                "band name"
-            ]
-            
-            result = classifier(text, candidate_labels)
-            
+            results = classify_texts(classifier, texts, self.nlp_batch_size)
+        except Exception as e:
+            logger.warning(f"NLP classification failed for {len(texts)} texts: {e}")
+            for text in texts:
+                scores[text]['fallback'] = True
+            return {text: True for text in texts}  # Fallback to allowing it
+        
+        decisions = {}
+        for text, result in zip(texts, results):
             # Debug output
             print(f"NLP Classification for '{text}':")
             for label, score in zip(result['labels'], result['scores']):
                 print(f"  {label}: {score:.3f}")
-            
-            # If "music genre" is the top prediction with decent confidence
-            if (result['labels'][0] == "music genre" and 
-                result['scores'][0] > 0.5):  # Increased threshold
-                return True
-            
-            # Also accept if music genre is second but close to first
-            if (len(result['labels']) > 1 and 
-                result['labels'][1] == "music genre" and
-                result['scores'][1] > 0.4 and
-                result['scores'][0] - result['scores'][1] < 0.2):
-                return True
-            
-            return False
-            
-        except Exception as e:
-            logger.warning(f"NLP classification failed for '{text}': {e}")
-            return True  # Fallback to allowing it
+            scores[text]['labels'] = {label: round(score, 4) for label, score in zip(result['labels'], result['scores'])}
+            decisions[text] = is_genre_classification(result)
+        return decisions
 
-    def _is_person_name_nlp(self, text: str) -> bool:
-        """Use NLP to detect if text is a person's name"""
+    def _detect_person_names_nlp(self, texts: List[str], scores: Dict[str, dict]) -> Dict[str, bool]:
+        """
+        Use spaCy NER to detect which texts are people's names. All texts go
+        through nlp.pipe together with only the NER components enabled.
+        PERSON entities found go into scores[text].
+        """
+        if not texts:
+            return {}
+        
         nlp = self._get_nlp()
         if not nlp:
-            return False
+            for text in texts:
+                scores[text]['fallback'] = True
+            return {text: False for text in texts}
         
         try:
-            # Add context to help spaCy recognize names
-            context_text = f"The musician {text} is known for their work."
-            doc = nlp(context_text)
-            
-            # Check for PERSON entities
-            for ent in doc.ents:
-                if ent.label_ == "PERSON" and text in ent.text:
-                    return True
-            
-            # Fallback: check without context
-            doc = nlp(text)
-            for ent in doc.ents:
-                if ent.label_ == "PERSON":
-                    return True
-            
-            return False
-            
+            unused = [name for name in nlp.pipe_names if name not in ('tok2vec', 'ner')]
+            entities = {}
+            with nlp.select_pipes(disable=unused):
+                # Add context to help spaCy recognize names
+                context_texts = [f"The musician {text} is known for their work." for text in texts]
+                for text, doc in zip(texts, nlp.pipe(context_texts, batch_size=self.nlp_batch_size)):
+                    entities[text] = [ent.text for ent in doc.ents if ent.label_ == "PERSON" and text in ent.text][:1]
+                
+                # Fallback: check without context
+                unmatched = [text for text in texts if not entities[text]]
+                for text, doc in zip(unmatched, nlp.pipe(unmatched, batch_size=self.nlp_batch_size)):
+                    entities[text] = [ent.text for ent in doc.ents if ent.label_ == "PERSON"][:1]
         except Exception as e:
-            logger.warning(f"NLP person detection failed for '{text}': {e}")
-            return False
\ No newline at end of file
+            logger.warning(f"NLP person detection failed for {len(texts)} texts: {e}")
+            for text in texts:
+                scores[text]['fallback'] = True
+            return {text: False for text in texts}
+        
+        for text, found in entities.items():
+            if found:
+                scores[text]['person_entities'] = found
+        return {text: bool(entities[text]) for text in texts}
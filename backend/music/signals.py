@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .gazetteer import add_known_genres
+from .genre_aliases import reload_canonicalizer
+from .models import Artist, Genre, GenreAlias, GenreTerm, MusicStats
+from .term_matcher import reload_term_matcher
+from .verdicts import verdict_store
+
+
+@receiver([post_save, post_delete], sender=GenreTerm)
+def genre_term_changed(sender, **kwargs):
+    """Rebuild the genre term matcher and drop memoized verdicts whenever the blocklist or allowlist changes."""
+    # Other processes rebuild as soon as the version is published, so wait until they can see the change
+    transaction.on_commit(term_lists_changed)
+
+
+def term_lists_changed():
+    reload_term_matcher()
+    verdict_store.clear()
+
+
+@receiver(post_save, sender=Genre)
+def genre_created(sender, instance, created, **kwargs):
+    """Newly stored genres are accepted without NLP from now on, and counted."""
+    if created:
+        add_known_genres([instance.name])
+        MusicStats.objects.adjust(total_genres=1)
+
+
+@receiver(post_delete, sender=Genre)
+def genre_deleted(sender, **kwargs):
+    MusicStats.objects.adjust(total_genres=-1)
+
+
+@receiver(post_save, sender=Artist)
+def artist_created(sender, instance, created, **kwargs):
+    if created:
+        MusicStats.objects.adjust(total_artists=1)
+
+
+@receiver(post_delete, sender=Artist)
+def artist_deleted(sender, instance, **kwargs):
+    MusicStats.objects.adjust(total_artists=-1, artists_with_genres=-1 if instance.genre_names else 0)
+
+
+@receiver([post_save, post_delete], sender=GenreAlias)
+def genre_alias_changed(sender, **kwargs):
+    """Rebuild the genre alias index whenever an alias is added, edited or removed."""
+    # Published after commit, like the term matcher
+    transaction.on_commit(reload_canonicalizer)
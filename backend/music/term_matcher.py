@@ -0,0 +1,138 @@
+from collections import deque
+from typing import Dict, Iterable, Set
+from .reloadable import Reloadable, read_table
+
+REJECT = 'reject'
+GENRE = 'genre'
+
+# Substrings that mark a candidate as a non-genre (labels, media, credits, ...)
+INVALID_TERMS = [
+    'discography', 'records', 'entertainment', 'music group',
+    'band', 'artist', 'label', 'inc.', 'ltd.', 'corporation',
+    'cite', 'ref', 'url', 'website', 'magazine', 'wikipedia',
+    'category:', 'file:', 'image:', 'template:', 'user:',
+    'list of', 'timeline of', 'history of',
+    'sub pop', 'truth and soul', 'def jam', 'columbia',
+    'atlantic', 'warner', 'universal', 'sony', 'emi',
+    'interscope', 'capitol', 'republic', 'rca', 'parlophone',
+    'flying tart', 'prometheus global media',
+    'group)', '(group)', 'collective', 'crew', 'posse',
+    'underground', 'thug life', 'outlawz', 'digital underground',
+    'death row', 'bad boy', 'roc-a-fella',
+    # Media outlets and websites
+    'allmusic', 'pitchfork', 'rolling stone', 'nme', 'spin',
+    'ones to watch', 'i-d', 'uproxx', 'billboard', 'complex',
+    'hypebeast', 'fader', 'stereogum', 'consequence of sound',
+    # TV/Radio personalities
+    'tablo', 'jeong hyeong-don', 'jimmy fallon', 'conan',
+    # Artist collaborations/side projects
+    'stephen malkmus and the jicks', 'hope sandoval & the warm inventions',
+    'hope sandoval and the warm inventions',
+]
+
+# Known artist names that commonly appear in genre fields
+KNOWN_ARTISTS = [
+    'morrissey', 'johnny marr', 'andy rourke', 'mike joyce',
+    'thom yorke', 'radiohead', 'kurt cobain', 'dave grohl'
+]
+
+# Substrings that mark a candidate as an obvious genre (accepted without NLP)
+OBVIOUS_GENRES = [
+    'rock', 'pop', 'jazz', 'hip hop', 'rap', 'metal', 'folk', 'country',
+    'electronic', 'dance', 'reggae', 'blues', 'punk', 'alternative',
+    'indie', 'soul', 'funk', 'r&b', 'classical', 'gospel', 'house',
+    'techno', 'trance', 'dubstep', 'ambient', 'experimental'
+]
+
+VERSION_CACHE_KEY = 'music:term_matcher_version'
+
+
+class TermMatcher:
+    """
+    Aho-Corasick automaton over lowercase terms, each tagged with a category.
+    classify() reports every category with a term occurring anywhere in the
+    text, in one pass over its characters.
+    """
+    
+    def __init__(self, terms: Dict[str, Iterable[str]]):
+        self._goto = [{}]
+        self._fail = [0]
+        outputs = [set()]
+        
+        for category, category_terms in terms.items():
+            for term in category_terms:
+                term = term.lower()
+                if not term:
+                    continue
+                node = 0
+                for char in term:
+                    if char not in self._goto[node]:
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                        self._goto[node][char] = len(self._goto) - 1
+                    node = self._goto[node][char]
+                outputs[node].add(category)
+        
+        # Breadth-first pass for failure links; each node inherits the
+        # categories of its failure node
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                outputs[child] |= outputs[self._fail[child]]
+        
+        self._output = [frozenset(categories) for categories in outputs]
+    
+    def classify(self, text: str) -> Set[str]:
+        """Categories of all terms found in text (case-insensitive)."""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found |= output[node]
+        return found
+
+
+def build_term_matcher() -> TermMatcher:
+    """Built-in lists plus the DB-managed blocklist and allowlist."""
+    from .models import GenreTerm
+    reject_terms = INVALID_TERMS + KNOWN_ARTISTS
+    genre_terms = list(OBVIOUS_GENRES)
+    
+    rows = read_table(lambda: list(GenreTerm.objects.values_list('term', 'kind')), [], 'built-in genre term lists')
+    for term, kind in rows:
+        if kind == GenreTerm.BLOCK:
+            reject_terms.append(term)
+        elif kind == GenreTerm.ALLOW:
+            genre_terms.append(term)
+    
+    return TermMatcher({REJECT: reject_terms, GENRE: genre_terms})
+
+
+# Rebuilt when another process publishes a new version (checked every TERM_MATCHER_RELOAD_INTERVAL seconds)
+_matcher = Reloadable(build_term_matcher, 'TERM_MATCHER_RELOAD_INTERVAL', version_key=VERSION_CACHE_KEY)
+
+
+def get_term_matcher() -> TermMatcher:
+    """The process-wide matcher, picking up term list edits made by other processes."""
+    return _matcher.get()
+
+
+def reload_term_matcher() -> None:
+    """Rebuild this process's matcher and tell the other processes to rebuild theirs."""
+    _matcher.reload()
+
+
+def get_term_matcher_version():
+    """Version of the term lists the current matcher was built from."""
+    return _matcher.version
@@ -1,3 +1,203 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+
+from .enrichment import GenreEnrichmentEngine
+from .genre_writer import write_artist_genres
+from .models import Artist, ArtistGenre, Genre, MusicStats
+from .term_matcher import GENRE, INVALID_TERMS, KNOWN_ARTISTS, OBVIOUS_GENRES, REJECT, TermMatcher
+from .wikitext import extract_infobox_genres, scan_lead_infobox, split_genre_value
+
+
+class InfoboxParserTests(SimpleTestCase):
+    def test_ref_with_nested_cite_template(self):
+        content = (
+            "{{Infobox musical artist\n"
+            "| name = Example\n"
+            "| genre = [[Indie rock]]<ref>{{cite web|url=https://example.com|title=A | B}}</ref>, [[Shoegaze]]\n"
+            "| label = [[Sub Pop]]\n"
+            "}}\n"
+        )
+        params, truncated = scan_lead_infobox(content)
+        
+        self.assertFalse(truncated)
+        self.assertEqual(params['label'], '[[Sub Pop]]')
+        self.assertEqual(extract_infobox_genres(content), ['Indie rock', 'Shoegaze'])
+    
+    def test_piped_link_yields_target(self):
+        self.assertEqual(split_genre_value('[[Hip hop music|hip hop]]'), ['Hip hop music'])
+    
+    def test_flatlist_bullets(self):
+        value = (
+            "{{flatlist|\n"
+            "* [[Alternative rock]]\n"
+            "* [[Hip hop music|hip hop]]\n"
+            "* shoegaze<ref name=\"a\"/>\n"
+            "}}"
+        )
+        self.assertEqual(split_genre_value(value), ['Alternative rock', 'Hip hop music', 'shoegaze'])
+    
+    def test_separators_and_comments(self):
+        value = "[[Alternative rock]] / [[Post-punk]]<!-- not | a genre -->; electronic"
+        self.assertEqual(split_genre_value(value), ['Alternative rock', 'Post-punk', 'electronic'])
+    
+    def test_infobox_cut_off_in_lead_section(self):
+        # Section 0 ends before the infobox closes
+        content = (
+            "{{Infobox musical artist\n"
+            "| name = Example\n"
+            "| genre = [[Rock music|Rock]], [[Pop music|pop]]\n"
+            "| years_active = 1990{{snd}}"
+        )
+        params, truncated = scan_lead_infobox(content)
+        
+        self.assertTrue(truncated)
+        self.assertEqual(params['genre'], '[[Rock music|Rock]], [[Pop music|pop]]')
+        self.assertEqual(extract_infobox_genres(content), ['Rock music', 'Pop music'])
+    
+    def test_no_infobox(self):
+        self.assertEqual(scan_lead_infobox('Plain article text.'), (None, False))
+        self.assertIsNone(extract_infobox_genres('Plain article text.'))
+
+
+
+class TermMatcherTests(SimpleTestCase):
+    def test_overlapping_terms(self):
+        matcher = TermMatcher({'a': ['she', 'hers'], 'b': ['he'], 'c': ['ushers']})
+        
+        self.assertEqual(matcher.classify('ushers'), {'a', 'b', 'c'})
+        self.assertEqual(matcher.classify('shells'), {'a', 'b'})
+        self.assertEqual(matcher.classify('hes'), {'b'})
+    
+    def test_term_found_through_failure_link(self):
+        # 'hip hop' only matches after backing out of a partial match of either term
+        matcher = TermMatcher({GENRE: ['hip hop'], REJECT: ['hip house records']})
+        
+        self.assertEqual(matcher.classify('Hip Hip Hop'), {GENRE})
+        self.assertEqual(matcher.classify('hip housE hip hop'), {GENRE})
+    
+    def test_parity_with_substring_checks(self):
+        matcher = TermMatcher({REJECT: INVALID_TERMS + KNOWN_ARTISTS, GENRE: OBVIOUS_GENRES})
+        samples = [
+            'Indie rock', 'Hip hop music', 'Sub Pop', 'Def Jam Recordings', 'Thom Yorke',
+            'Shoegaze', 'Dream pop', 'K-pop', 'R&B', 'Bandcamp', 'Rock and roll',
+            'Category:Albums', 'Neo-psychedelia', 'Death Row Records', 'Jazz rap',
+            'Chamber folk', 'Trip hop', 'Electronic dance music', '', 'Allmusic',
+        ]
+        for text in samples:
+            lower = text.lower()
+            expected = set()
+            if any(term in lower for term in INVALID_TERMS + KNOWN_ARTISTS):
+                expected.add(REJECT)
+            if any(term in lower for term in OBVIOUS_GENRES):
+                expected.add(GENRE)
+            self.assertEqual(matcher.classify(text), expected, text)
+
+
+class ResolveSpotifyArtistsTests(TestCase):
+    def test_name_match_ignores_rows_bound_to_another_spotify_artist(self):
+        mia = Artist.objects.create(name='M.I.A.', spotify_id='mia_id')
+        GenreEnrichmentEngine().store_spotify_genres([{'id': 'mia_id', 'name': 'M.I.A.', 'genres': ['grime']}])
+        
+        db_artists = GenreEnrichmentEngine().store_spotify_genres(
+            [{'id': 'other_mia', 'name': 'MIA', 'genres': ['deutschpop']}]
+        )
+        
+        other = db_artists['other_mia']
+        self.assertNotEqual(other.id, mia.id)
+        self.assertEqual(Artist.objects.get(spotify_id='other_mia').name, 'MIA')
+        self.assertEqual(
+            list(ArtistGenre.objects.filter(artist=mia).values_list('genre__name', flat=True)), ['grime']
+        )
+        self.assertEqual(
+            list(ArtistGenre.objects.filter(artist=other).values_list('genre__name', flat=True)), ['deutschpop']
+        )
+    
+    def test_name_match_binds_unbound_row_once(self):
+        legacy = Artist.objects.create(name='M.I.A.')
+        
+        resolved = Artist.objects.resolve_spotify_artists(
+            [{'id': 'mia_id', 'name': 'M.I.A.'}, {'id': 'other_mia', 'name': 'MIA'}]
+        )
+        
+        self.assertEqual(resolved, {'mia_id': legacy})
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.spotify_id, 'mia_id')
+        self.assertEqual(Artist.objects.resolve_spotify_artists([{'id': 'other_mia', 'name': 'MIA'}]), {})
+
+
+class WriteArtistGenresTests(TestCase):
+    def test_rewrite_diffs_links_of_one_source(self):
+        slowdive, ride = Artist.objects.create(name='Slowdive'), Artist.objects.create(name='Ride')
+        write_artist_genres({slowdive: ['Dream pop']}, source=ArtistGenre.SPOTIFY)
+        write_artist_genres({slowdive: ['Shoegaze', 'Dream pop', 'Ambient'], ride: ['Shoegaze']})
+        kept = ArtistGenre.objects.get(artist=slowdive, genre__name='Shoegaze', source=ArtistGenre.WIKIPEDIA)
+        
+        # Every genre exists and no confidence changed: read genres and links,
+        # delete the dropped link, update the snapshots, inside one savepoint
+        with self.assertNumQueries(6):
+            write_artist_genres({slowdive: ['Dream pop', 'Shoegaze'], ride: ['Shoegaze']})
+        
+        self.assertEqual(
+            set(ArtistGenre.objects.filter(artist=slowdive).values_list('genre__name', 'source')),
+            {('Dream pop', ArtistGenre.SPOTIFY), ('Dream pop', ArtistGenre.WIKIPEDIA), ('Shoegaze', ArtistGenre.WIKIPEDIA)}
+        )
+        self.assertTrue(ArtistGenre.objects.filter(id=kept.id).exists())
+        slowdive.refresh_from_db()
+        self.assertEqual(slowdive.genre_names, ['Dream pop', 'Shoegaze'])
+    
+    def test_rewrite_upserts_only_changed_confidence(self):
+        slowdive = Artist.objects.create(name='Slowdive')
+        write_artist_genres({slowdive: ['Shoegaze', 'Dream pop']}, confidence=Decimal('0.50'))
+        
+        # One more query than a rewrite with unchanged confidence: the upsert
+        with self.assertNumQueries(7):
+            write_artist_genres({slowdive: ['Shoegaze']}, confidence=Decimal('0.90'))
+        
+        self.assertEqual(
+            list(ArtistGenre.objects.filter(artist=slowdive).values_list('genre__name', 'confidence')),
+            [('Shoegaze', Decimal('0.90'))]
+        )
+        slowdive.refresh_from_db()
+        self.assertEqual(slowdive.genre_names, ['Shoegaze'])
+
+
+class MusicStatsCounterTests(TestCase):
+    def setUp(self):
+        MusicStats.objects.reconcile()
+    
+    def assertStatsReconciled(self):
+        fields = ['total_artists', 'artists_with_genres', 'total_genres']
+        counted = MusicStats.objects.values(*fields).get()
+        self.assertEqual(counted, {field: getattr(MusicStats.objects.reconcile(), field) for field in fields})
+    
+    def test_write_with_some_genres_already_stored(self):
+        Genre.objects.create(name='Shoegaze')
+        artist = Artist.objects.create(name='Slowdive')
+        
+        write_artist_genres({artist: ['Shoegaze', 'Dream pop', 'Ambient']})
+        
+        self.assertEqual(MusicStats.objects.get().total_genres, 3)
+        self.assertStatsReconciled()
+    
+    def test_rewrite_removing_all_genres(self):
+        artist = Artist.objects.create(name='Slowdive')
+        write_artist_genres({artist: ['Shoegaze', 'Dream pop']})
+        
+        write_artist_genres({artist: []})
+        
+        self.assertEqual(MusicStats.objects.get().artists_with_genres, 0)
+        self.assertStatsReconciled()
+    
+    def test_create_artists_upserting_existing_spotify_id(self):
+        Artist.objects.create(name='Slowdive', spotify_id='slowdive_id')
+        db_artists = {}
+        
+        GenreEnrichmentEngine()._create_artists(
+            [{'id': 'slowdive_id', 'name': 'Slowdive (band)'}, {'id': 'ride_id', 'name': 'Ride'}], db_artists
+        )
+        
+        self.assertEqual(Artist.objects.get(spotify_id='slowdive_id').name, 'Slowdive (band)')
+        self.assertEqual(set(db_artists), {'slowdive_id', 'ride_id'})
+        self.assertEqual(MusicStats.objects.get().total_artists, 2)
+        self.assertStatsReconciled()
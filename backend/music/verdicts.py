@@ -0,0 +1,134 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+from django.conf import settings
+from .term_matcher import get_term_matcher_version
+
+logger = logging.getLogger(__name__)
+
+# The stage of _is_valid_genre that decided a verdict
+STAGE_LENGTH = 'length'
+STAGE_RULE = 'rule'
+STAGE_PATTERN = 'pattern'
+STAGE_OBVIOUS = 'obvious'
+STAGE_GAZETTEER = 'gazetteer'
+STAGE_PERSON_NLP = 'person_nlp'
+STAGE_GENRE_NLP = 'genre_nlp'
+STAGE_NOT_SUSPICIOUS = 'not_suspicious'
+
+# Verdicts that are cheaper to recompute than to look up
+UNSTORED_STAGES = {STAGE_LENGTH}
+
+# The stages in the order _judge_genre_by_rules and the NLP pass run them
+STAGE_ORDER = [
+    STAGE_LENGTH, STAGE_RULE, STAGE_GAZETTEER, STAGE_PATTERN, STAGE_OBVIOUS,
+    STAGE_NOT_SUSPICIOUS, STAGE_PERSON_NLP, STAGE_GENRE_NLP,
+]
+
+# Stages that run after the gazetteer; their rejections yield to it once a string becomes a known genre
+AFTER_GAZETTEER_STAGES = set(STAGE_ORDER[STAGE_ORDER.index(STAGE_GAZETTEER) + 1:])
+
+
+def normalize_verdict_key(text: str) -> str:
+    """Collapse whitespace only; validation looks at capitalization, so case is kept."""
+    return ' '.join(text.split())
+
+
+class GenreVerdictStore:
+    """
+    Two-level memo of genre validation verdicts: an in-process LRU in front of
+    the GenreVerdict table. Each verdict is {'accepted', 'stage', 'scores'}.
+    
+    LRU entries are tagged with the term matcher version, so edits to the
+    blocklist/allowlist invalidate them in every process; the table itself is
+    emptied by clear() when the term lists change.
+    
+    Database failures are logged and treated as misses.
+    """
+    
+    def __init__(self, maxsize: Optional[int] = None):
+        if maxsize is None:
+            maxsize = getattr(settings, 'GENRE_VERDICT_LRU_SIZE', 10000)
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_many(self, texts: Iterable[str]) -> Dict[str, dict]:
+        """Return {normalized text: verdict} for every text with a stored verdict."""
+        version = get_term_matcher_version()
+        results = {}
+        missing = []
+        
+        with self._lock:
+            for key in {normalize_verdict_key(text) for text in texts}:
+                verdict = self._lru.get((version, key))
+                if verdict is None:
+                    missing.append(key)
+                else:
+                    self._lru.move_to_end((version, key))
+                    results[key] = verdict
+        
+        if missing:
+            from .models import GenreVerdict
+            try:
+                rows = GenreVerdict.objects.filter(text__in=missing).values_list('text', 'accepted', 'stage', 'scores')
+                stored = {text: {'accepted': accepted, 'stage': stage, 'scores': scores}
+                          for text, accepted, stage, scores in rows}
+            except Exception as e:
+                logger.warning(f"Genre verdict lookup failed: {e}")
+                stored = {}
+            self._remember(version, stored)
+            results.update(stored)
+        
+        return results
+    
+    def put_many(self, verdicts: Dict[str, dict]) -> None:
+        """Record {text: verdict} in this process and in the shared table, replacing older verdicts."""
+        version = get_term_matcher_version()
+        # Verdicts reached without a model (not installed or failed) are not final
+        verdicts = {
+            normalize_verdict_key(text): verdict for text, verdict in verdicts.items()
+            if not (verdict.get('scores') or {}).get('fallback')
+        }
+        self._remember(version, verdicts)
+        
+        from .models import GenreVerdict
+        rows = [
+            GenreVerdict(text=text, accepted=verdict['accepted'], stage=verdict['stage'], scores=verdict.get('scores') or {})
+            for text, verdict in verdicts.items()
+            if verdict['stage'] not in UNSTORED_STAGES and len(text) <= 100
+        ]
+        if not rows:
+            return
+        try:
+            GenreVerdict.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['text'],
+                update_fields=['accepted', 'stage', 'scores']
+            )
+        except Exception as e:
+            logger.warning(f"Genre verdict write failed: {e}")
+    
+    def clear(self) -> None:
+        """Forget every verdict, e.g. after the genre term lists change."""
+        with self._lock:
+            self._lru.clear()
+        
+        from .models import GenreVerdict
+        try:
+            GenreVerdict.objects.all().delete()
+        except Exception as e:
+            logger.warning(f"Genre verdict clear failed: {e}")
+    
+    def _remember(self, version, verdicts: Dict[str, dict]) -> None:
+        with self._lock:
+            for key, verdict in verdicts.items():
+                self._lru[(version, key)] = verdict
+                self._lru.move_to_end((version, key))
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+
+verdict_store = GenreVerdictStore()
@@ -0,0 +1,211 @@
+import re
+from typing import List, Optional, Tuple
+
+INFOBOX_START = re.compile(r'\{\{\s*Infobox', re.IGNORECASE)
+
+# Tokens that matter while scanning an infobox; <ref> blocks and comments are
+# consumed whole so their pipes and braces are ignored
+INFOBOX_TOKEN = re.compile(
+    r'<!--.*?(?:-->|\Z)'
+    r'|<ref[^>]*?/>'
+    r'|<ref[^>]*>.*?(?:</ref\s*>|\Z)'
+    r'|\{\{|\}\}|\[\[|\]\]|\|',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Markup removed from a parameter value before it is split into items
+VALUE_NOISE = re.compile(
+    r'<!--.*?(?:-->|\Z)'
+    r'|<ref[^>]*?/>'
+    r'|<ref[^>]*>.*?(?:</ref\s*>|\Z)'
+    r'|<[^>]+>'
+    r'|&[a-z]+;'
+    r"|'{2,}",
+    re.IGNORECASE | re.DOTALL
+)
+
+VALUE_TOKEN = re.compile(r'\{\{|\}\}|\[\[|\]\]|\||[,;/\n•]|[^{}\[\]|,;/\n•]+|[{}\[\]]')
+
+SEPARATORS = {',', ';', '/', '\n', '•'}
+
+GENRE_PARAMS = {'genre', 'genres'}
+
+# Templates whose positional arguments are separate list items
+LIST_TEMPLATES = {
+    'hlist', 'flatlist', 'flat list', 'plainlist', 'plain list',
+    'ubl', 'ubil', 'unbulleted list', 'bulleted list', 'blist', 'nowrap',
+}
+
+# Templates that never contain genres
+IGNORED_TEMPLATES = {'cite web', 'cite news', 'cite book', 'cite magazine', 'citation', 'efn', 'sfn', 'refn', 'r'}
+
+
+def scan_lead_infobox(content: str) -> Tuple[Optional[dict], bool]:
+    """
+    Scan the first infobox in one linear pass with a compiled tokenizer.
+    Template braces, links, <ref> blocks and comments are matched as tokens,
+    so pipes inside them never split a parameter, and scanning stops at the
+    brace that closes the infobox.
+    Returns ({param name: raw value}, truncated). Params is None when the page
+    has no infobox; truncated is True when the infobox never closes.
+    """
+    match = INFOBOX_START.search(content)
+    if not match:
+        return None, False
+    
+    depth = 0
+    link_depth = 0
+    boundaries = []
+    
+    for token in INFOBOX_TOKEN.finditer(content, match.start()):
+        text = token.group()
+        if text == '{{':
+            depth += 1
+        elif text == '}}':
+            depth -= 1
+            if depth == 0:
+                boundaries.append(token.start())
+                return _split_params(content, boundaries), False
+        elif text == '[[':
+            link_depth += 1
+        elif text == ']]':
+            link_depth = max(link_depth - 1, 0)
+        elif text == '|' and depth == 1 and link_depth == 0:
+            boundaries.append(token.start())
+    
+    boundaries.append(len(content))
+    return _split_params(content, boundaries), True
+
+
+def _split_params(content: str, boundaries: List[int]) -> dict:
+    """Turn the positions of top-level pipes into {name: value} parameters."""
+    params = {}
+    for start, end in zip(boundaries, boundaries[1:]):
+        name, sep, value = content[start + 1:end].partition('=')
+        if sep:
+            params[name.strip().lower()] = value.strip()
+    return params
+
+
+def extract_infobox_genres(content: str) -> Optional[List[str]]:
+    """Raw genre strings from the lead infobox, or None when there is no genre field."""
+    params, _ = scan_lead_infobox(content)
+    if not params:
+        return None
+    
+    for name in GENRE_PARAMS:
+        if name in params:
+            return split_genre_value(params[name])
+    return None
+
+
+def split_genre_value(value: str) -> List[str]:
+    """
+    Split an infobox genre value into one string per listed genre.
+    Handles hlist/flatlist/ubl templates, bullets, separators and links
+    (which yield their target); <ref> blocks, comments and HTML are dropped.
+    """
+    tokens = VALUE_TOKEN.findall(VALUE_NOISE.sub('', value))
+    nodes, _ = _parse_nodes(tokens, 0, ())
+    return _flatten_items(nodes)
+
+
+class _Template:
+    __slots__ = ('name', 'args')
+    
+    def __init__(self, name: str, args: List[list]):
+        self.name = name
+        self.args = args
+
+
+class _Link:
+    __slots__ = ('target',)
+    
+    def __init__(self, target: str):
+        self.target = target
+
+
+def _parse_nodes(tokens: List[str], i: int, stop: tuple) -> Tuple[list, int]:
+    nodes = []
+    while i < len(tokens):
+        token = tokens[i]
+        if token in stop:
+            return nodes, i
+        if token == '{{':
+            template, i = _parse_template(tokens, i + 1)
+            nodes.append(template)
+        elif token == '[[':
+            link, i = _parse_link(tokens, i + 1)
+            nodes.append(link)
+        else:
+            nodes.append(token)
+            i += 1
+    return nodes, i
+
+
+def _parse_template(tokens: List[str], i: int) -> Tuple[_Template, int]:
+    args = []
+    while i < len(tokens):
+        arg, i = _parse_nodes(tokens, i, ('|', '}}'))
+        args.append(arg)
+        if i >= len(tokens) or tokens[i] == '}}':
+            i += 1
+            break
+        i += 1  # skip '|'
+    
+    name = ''.join(node for node in args[0] if isinstance(node, str)).strip().lower() if args else ''
+    return _Template(name, args[1:]), i
+
+
+def _parse_link(tokens: List[str], i: int) -> Tuple[_Link, int]:
+    target = []
+    in_target = True
+    while i < len(tokens) and tokens[i] != ']]':
+        token = tokens[i]
+        if token == '|':
+            in_target = False
+        elif token == '[[':
+            # Nested links only appear in file captions; skip them
+            _, i = _parse_link(tokens, i + 1)
+            continue
+        elif in_target:
+            target.append(token)
+        i += 1
+    return _Link(''.join(target).split('#')[0].strip()), i + 1
+
+
+def _flatten_items(nodes: list) -> List[str]:
+    items = []
+    current = []
+    
+    def flush():
+        links = [node.target for node in current if isinstance(node, _Link)]
+        if links:
+            items.extend(target for target in links if target)
+        else:
+            text = ''.join(node for node in current if isinstance(node, str)).strip(' \t*#:-')
+            if text:
+                items.append(text)
+        current.clear()
+    
+    for node in nodes:
+        if isinstance(node, _Template):
+            if node.name in IGNORED_TEMPLATES or node.name.startswith('cite'):
+                continue
+            flush()
+            # Skip named arguments such as class= or style=
+            args = [arg for arg in node.args if not (arg and isinstance(arg[0], str) and '=' in arg[0])]
+            # Other wrappers (e.g. {{lang|ko|K-pop}}) keep only their last argument
+            if node.name not in LIST_TEMPLATES:
+                args = args[-1:]
+            for arg in args:
+                items.extend(_flatten_items(arg))
+        elif isinstance(node, _Link):
+            current.append(node)
+        elif node in SEPARATORS:
+            flush()
+        else:
+            current.append(node)
+    
+    flush()
+    return items
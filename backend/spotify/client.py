@@ -0,0 +1,152 @@
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Optional
+from urllib.parse import urlparse
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter, Retry
+
+logger = logging.getLogger(__name__)
+
+API_BASE_URL = 'https://api.spotify.com/v1'
+TOKEN_URL = 'https://accounts.spotify.com/api/token'
+
+# Upstream statuses retried with exponential backoff
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class SpotifyClient:
+    """
+    HTTP client for the Spotify Web API and accounts service. One keep-alive
+    connection pool is shared by every request made through it. Calls time
+    out after SPOTIFY_CONNECT_TIMEOUT / SPOTIFY_READ_TIMEOUT seconds.
+    Connection failures and 5xx responses are retried with exponential
+    backoff, but 5xx responses to POSTs are not, since a token exchange must
+    not be replayed. Each call's latency is recorded per endpoint (see stats()).
+    """
+    
+    def __init__(self, connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None, backoff_factor: Optional[float] = None,
+                 pool_maxsize: Optional[int] = None):
+        if connect_timeout is None:
+            connect_timeout = getattr(settings, 'SPOTIFY_CONNECT_TIMEOUT', 3.05)
+        if read_timeout is None:
+            read_timeout = getattr(settings, 'SPOTIFY_READ_TIMEOUT', 10)
+        self.timeout = (connect_timeout, read_timeout)
+        
+        if max_retries is None:
+            max_retries = getattr(settings, 'SPOTIFY_MAX_RETRIES', 3)
+        if backoff_factor is None:
+            backoff_factor = getattr(settings, 'SPOTIFY_RETRY_BACKOFF', 0.5)
+        if pool_maxsize is None:
+            pool_maxsize = getattr(settings, 'SPOTIFY_POOL_MAXSIZE', 10)
+        
+        retry = Retry(
+            total=max_retries,
+            status_forcelist=RETRY_STATUSES,
+            backoff_factor=backoff_factor,
+            # A 5xx Retry-After can ask for minutes; keep the wait bounded by our backoff
+            respect_retry_after_header=False,
+            # Give the caller the last response instead of raising
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=max(pool_maxsize, 1), max_retries=retry)
+        
+        self.session = requests.Session()
+        self.session.mount('https://api.spotify.com/', adapter)
+        self.session.mount('https://accounts.spotify.com/', adapter)
+        
+        # Latency samples (seconds) and counters per endpoint path
+        self._samples = {}
+        self._counters = {}
+        self._sample_size = getattr(settings, 'SPOTIFY_LATENCY_SAMPLES', 500)
+        self._lock = threading.Lock()
+    
+    def get(self, path: str, access_token: str, params: Optional[dict] = None) -> requests.Response:
+        """GET a Web API path such as '/me/top/artists' with a user's access token."""
+        return self.request(
+            'GET', API_BASE_URL + path,
+            headers={'Authorization': f'Bearer {access_token}'},
+            params=params
+        )
+    
+    def request_token(self, data: dict, **kwargs) -> requests.Response:
+        """POST to the accounts token endpoint (code exchange or refresh)."""
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        headers.update(kwargs.pop('headers', {}))
+        return self.request('POST', TOKEN_URL, data=data, headers=headers, **kwargs)
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session, recording its latency."""
+        kwargs.setdefault('timeout', self.timeout)
+        endpoint = f'{method} {urlparse(url).path}'
+        
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            elapsed = time.perf_counter() - start
+            self._record(endpoint, elapsed, error=True)
+            logger.warning(f"Spotify {endpoint} failed after {elapsed * 1000:.0f}ms: {str(e)}")
+            raise
+        
+        elapsed = time.perf_counter() - start
+        retry_state = getattr(response.raw, 'retries', None)
+        retries = len(retry_state.history) if retry_state else 0
+        self._record(endpoint, elapsed, error=response.status_code >= 500, retries=retries)
+        logger.debug(f"Spotify {endpoint} -> {response.status_code} in {elapsed * 1000:.0f}ms ({retries} retries)")
+        return response
+    
+    def _record(self, endpoint: str, elapsed: float, error: bool = False, retries: int = 0) -> None:
+        with self._lock:
+            if endpoint not in self._samples:
+                self._samples[endpoint] = deque(maxlen=self._sample_size)
+                self._counters[endpoint] = {'calls': 0, 'errors': 0, 'retries': 0}
+            self._samples[endpoint].append(elapsed)
+            counters = self._counters[endpoint]
+            counters['calls'] += 1
+            counters['errors'] += int(error)
+            counters['retries'] += retries
+    
+    def stats(self) -> dict:
+        """Call counts and latency percentiles (ms, over recent calls) per endpoint."""
+        with self._lock:
+            snapshot = {endpoint: (list(samples), dict(self._counters[endpoint])) for endpoint, samples in self._samples.items()}
+        
+        endpoints = {}
+        for endpoint, (samples, counters) in snapshot.items():
+            ordered = sorted(samples)
+            endpoints[endpoint] = dict(
+                counters,
+                p50_ms=round(statistics.median(ordered) * 1000, 1),
+                p95_ms=round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 1),
+                max_ms=round(ordered[-1] * 1000, 1),
+            )
+        return {'pid': os.getpid(), 'timeout': list(self.timeout), 'endpoints': endpoints}
+
+
+_client = None
+_client_pid = None
+_lock = threading.Lock()
+
+
+def get_spotify_client() -> SpotifyClient:
+    """
+    The process-wide client. A forked worker builds its own, so pooled
+    connections are never shared across processes.
+    """
+    global _client, _client_pid
+    
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+    
+    with _lock:
+        if _client is None or _client_pid != pid:
+            _client = SpotifyClient()
+            _client_pid = pid
+        return _client
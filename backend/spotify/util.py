@@ -1,5 +1,5 @@
-import requests
 from django.conf import settings
+from .client import get_spotify_client
 from .models import SpotifyToken
 from datetime import datetime, timedelta
 from django.utils import timezone
@@ -33,9 +33,6 @@ def refresh_spotify_token(session_id):
         
         refresh_token = user_token.refresh_token
         
-        # Spotify token refresh endpoint
-        url = 'https://accounts.spotify.com/api/token'
-        
         data = {
             'grant_type': 'refresh_token',
             'refresh_token': refresh_token,
@@ -48,7 +45,7 @@ def refresh_spotify_token(session_id):
         # Use your Spotify client credentials
         auth = (settings.SPOTIFY_CLIENT_ID, settings.SPOTIFY_CLIENT_SECRET)
         
-        response = requests.post(url, data=data, headers=headers, auth=auth)
+        response = get_spotify_client().request_token(data, headers=headers, auth=auth)
         
         if response.status_code == 200:
             response_data = response.json()
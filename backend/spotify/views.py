@@ -9,6 +9,7 @@ import os
 from django.utils import timezone
 from datetime import timedelta
 from django.conf import settings
+from .client import get_spotify_client
 from .models import SpotifyToken
 
 # Spotify API credentials - use Django settings instead of os.getenv
@@ -56,7 +57,6 @@ def callback(request):
     user_session_key = request.session.session_key
 
     auth_options = {
-        'url': 'https://accounts.spotify.com/api/token',
         'data': {
             'code': code,
             'redirect_uri': REDIRECT_URI,
@@ -68,7 +68,10 @@ def callback(request):
         }
     }
 
-    response = requests.post(auth_options['url'], data=auth_options['data'], headers=auth_options['headers'])
+    try:
+        response = get_spotify_client().request_token(auth_options['data'], headers=auth_options['headers'])
+    except requests.RequestException:
+        return redirect('/#' + urlencode({'error': 'spotify_unavailable'}))
     
     # Setting Up
     if response.status_code == 200:
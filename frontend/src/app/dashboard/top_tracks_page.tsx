@@ -100,8 +100,11 @@ export default function TopTracksPage(): React.JSX.Element {
         })
 
         if (artistsResponse.ok) {
-          const fetchedArtistsData = await artistsResponse.json()
-          setArtistsData(fetchedArtistsData)
+          const { artists, failed } = await artistsResponse.json()
+          setArtistsData(artists)
+          if (failed && Object.keys(failed).length > 0) {
+            console.warn("Failed to fetch some artists:", failed)
+          }
         } else {
           console.error("Failed to fetch artists:", await artistsResponse.text())
         }